@@ -0,0 +1,68 @@
+"""
+Headless game throughput benchmark.
+
+Plays a fixed, seeded sequence of games with no reporter and prints games/sec, then
+times the period loop (simulate_period) on its own in microseconds per period. Both
+numbers are the best of several repeats, so engine changes can be compared run to run.
+
+    python benchmarks/bench_game.py --games 500 --repeat 5
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from newHockeyGameSimulator import HockeyGameSimulator  # noqa: E402
+
+
+def time_games(league: bytes, games: int, seed: int) -> float:
+    simulator = HockeyGameSimulator(seed=seed)
+    simulator.adopt_teams(pickle.loads(league))
+    teams = simulator.teams
+    pairs = [(teams[i % len(teams)], teams[(i + 1) % len(teams)]) for i in range(games)]
+    simulate_game = simulator.simulate_game
+    start = time.perf_counter()
+    for team1, team2 in pairs:
+        simulate_game(team1, team2)
+    return time.perf_counter() - start
+
+
+def time_periods(league: bytes, periods: int, seed: int) -> float:
+    simulator = HockeyGameSimulator(seed=seed)
+    simulator.adopt_teams(pickle.loads(league))
+    team1, team2 = simulator.teams[0], simulator.teams[1]
+    team1.current_line = team1.lines[0]
+    team2.current_line = team2.lines[0]
+    team1._initial_update_active_goaltender()
+    team2._initial_update_active_goaltender()
+    simulate_period = simulator.simulate_period
+    start = time.perf_counter()
+    for i in range(periods):
+        simulate_period(team1, team2, i % 3 + 1)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--periods", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    simulator = HockeyGameSimulator(seed=args.seed)
+    simulator.create_league()
+    league = pickle.dumps(simulator.teams)
+    best = min(time_games(league, args.games, args.seed) for _ in range(args.repeat))
+    print(f"simulate_game: {args.games / best:,.0f} games/sec "
+          f"({best / args.games * 1e6:,.0f} us/game, best of {args.repeat})")
+    best = min(time_periods(league, args.periods, args.seed) for _ in range(args.repeat))
+    print(f"simulate_period: {best / args.periods * 1e6:,.1f} us/period "
+          f"({args.periods} periods, best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+League memory benchmark.
+
+Measures the bytes allocated by one league of 32 teams with their rosters and lines
+(create_league() plus generating every lazy roster) with tracemalloc, and the size of the pickled league that parallel replicas
+ship to worker processes.
+
+    python benchmarks/bench_memory.py --leagues 20
+"""
+import argparse
+import os
+import pickle
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from newHockeyGameSimulator import HockeyGameSimulator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--leagues", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Keep the simulators alive so each league's memory stays allocated while measured.
+    simulators = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(args.leagues):
+        simulator = HockeyGameSimulator(seed=args.seed + i)
+        simulator.create_league()
+        for team in simulator.teams:
+            team.players  # generate the lazy roster
+        simulators.append(simulator)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    pickled = len(pickle.dumps(simulators[0].teams, protocol=pickle.HIGHEST_PROTOCOL))
+    print(f"league: {used / args.leagues:,.0f} bytes per league "
+          f"({args.leagues} leagues), pickled league {pickled:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Load test for the asyncio simulation service.
+
+Starts a SimulationService on a free local port in this process, then runs many
+concurrent clients against it: most ask for games (a few distinct matchups, so many
+requests are identical and coalesce), some ask for seasons, and the rest poll
+/standings. Reports throughput, latency percentiles per endpoint and the service
+counters (jobs run, coalesced duplicates, requests refused with 503).
+
+    python benchmarks/bench_service.py --clients 200 --requests 20 --workers 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from newHockeyGameSimulator import HockeyGameSimulator, SimulationService  # noqa: E402
+
+
+async def fetch(port, target):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("ascii"))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status = int(response.split(b" ", 2)[1])
+    return status, json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+
+async def client(port, requests, rng, latencies, statuses):
+    for _ in range(requests):
+        roll = rng.random()
+        if roll < 0.6:
+            endpoint, target = "game", f"/game?team1={rng.randrange(4)}&team2={4 + rng.randrange(4)}"
+        elif roll < 0.7:
+            endpoint, target = "season", f"/season?games_per_team=10&seed={rng.randrange(3)}"
+        else:
+            endpoint, target = "standings", "/standings"
+        start = time.perf_counter()
+        status, _ = await fetch(port, target)
+        latencies.setdefault(endpoint, []).append(time.perf_counter() - start)
+        statuses[status] = statuses.get(status, 0) + 1
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def run(args):
+    simulator = HockeyGameSimulator(seed=args.seed)
+    simulator.create_league()
+    service = SimulationService(simulator, workers=args.workers, max_pending=args.max_pending)
+    server = await service.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        latencies, statuses = {}, {}
+        start = time.perf_counter()
+        await asyncio.gather(*(client(port, args.requests, random.Random(i), latencies, statuses)
+                               for i in range(args.clients)))
+        elapsed = time.perf_counter() - start
+        _, counters = await fetch(port, "/stats")
+    finally:
+        server.close()
+        await server.wait_closed()
+        service.close()
+
+    total = args.clients * args.requests
+    print(f"{total} requests from {args.clients} clients in {elapsed:.2f}s ({total / elapsed:,.0f} req/s), "
+          f"statuses {dict(sorted(statuses.items()))}")
+    print(f"{'endpoint':<12}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+    for endpoint, values in sorted(latencies.items()):
+        print(f"{endpoint:<12}{len(values):>7}{percentile(values, 0.5) * 1000:>9.1f}"
+              f"{percentile(values, 0.95) * 1000:>9.1f}{max(values) * 1000:>9.1f}")
+    print("service counters:", {key: counters[key] for key in ("jobs", "coalesced", "rejected", "errors")})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-pending", type=int, help="service backpressure limit (default 8 per worker)")
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
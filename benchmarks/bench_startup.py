@@ -0,0 +1,67 @@
+"""
+Cold-start benchmark: time from a fresh interpreter to the first game result.
+
+Each run starts a new Python process that imports the simulator, creates a seeded
+league and plays one game, timing each phase; the parent also times the whole process.
+The median over --runs is printed per phase. --eager builds every team's roster before
+the game, as create_league did before rosters became lazy, for comparison. The module
+is byte-compiled first, so import times do not include compiling the source.
+
+    python benchmarks/bench_startup.py --runs 20
+    python benchmarks/bench_startup.py --runs 20 --eager
+"""
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from newHockeyGameSimulator import HockeyGameSimulator
+imported = time.perf_counter()
+simulator = HockeyGameSimulator(seed=1)
+simulator.create_league()
+if {eager}:
+    for team in simulator.teams:
+        team.players
+league = time.perf_counter()
+simulator.simulate_game(simulator.teams[0], simulator.teams[1])
+done = time.perf_counter()
+json.dump({{"import": imported - start, "league": league - imported, "first game": done - league,
+           "import to result": done - start}}, sys.stdout)
+"""
+
+
+def run_once(eager: bool) -> dict:
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", CHILD.format(eager=eager)], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    phases = json.loads(output)
+    phases["process"] = time.perf_counter() - start
+    return phases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--eager", action="store_true", help="generate all 32 rosters up front")
+    args = parser.parse_args()
+
+    compileall.compile_file(os.path.join(ROOT, "newHockeyGameSimulator.py"), quiet=1)
+    runs = [run_once(args.eager) for _ in range(args.runs)]
+    print(f"{'phase':<18}{'median ms':>10}{'min ms':>9}   ({args.runs} runs, "
+          f"{'eager' if args.eager else 'lazy'} league)")
+    for phase in runs[0]:
+        values = [run[phase] * 1000 for run in runs]
+        print(f"{phase:<18}{statistics.median(values):>10.2f}{min(values):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
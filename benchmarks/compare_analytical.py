@@ -0,0 +1,99 @@
+"""
+Accuracy check of the analytical matchup engine against Monte Carlo games.
+
+The analytical engine answers the whole league's odds matrix at once; the script then
+plays --games games for each of --pairs random matchups, every game starting from
+the same league state, and compares win, overtime and shootout rates. The Monte Carlo
+side uses the vectorized engine by default (compare_engines.py checks that it matches
+the scalar engine) or the scalar engine itself with --engine scalar. It exits with
+status 1 if the mean absolute error of the win probability exceeds --max-error.
+
+    python benchmarks/compare_analytical.py --pairs 40 --games 4000 --seed 1
+"""
+import argparse
+import os
+import pickle
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from newHockeyGameSimulator import DECISIONS, HockeyGameSimulator, VectorizedEngine  # noqa: E402
+
+METRICS = ("team1_win",) + DECISIONS[1:]
+
+
+def scalar_rates(teams, index1, index2, games, seed):
+    simulator = HockeyGameSimulator(seed=seed)
+    snapshot = pickle.dumps([teams[index1], teams[index2]])
+    counts = dict.fromkeys(METRICS, 0)
+    for _ in range(games):
+        # Fresh copy of the two teams so every game starts from the same state.
+        pair = pickle.loads(snapshot)
+        simulator.adopt_teams(pair)
+        result = simulator.simulate_game(*pair)
+        counts["team1_win"] += result.score1 > result.score2
+        if result.decision != DECISIONS[0]:
+            counts[result.decision] += 1
+    return {name: count / games for name, count in counts.items()}
+
+
+def vectorized_rates(teams, index1, index2, games, seed):
+    batch = VectorizedEngine(seed=seed).simulate([(teams[index1], teams[index2])] * games)
+    rates = batch.decision_rates()
+    rates["team1_win"] = float((batch.score1 > batch.score2).mean())
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=40)
+    parser.add_argument("--games", type=int, default=4000, help="Monte Carlo games per pair")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--engine", choices=("vectorized", "scalar"), default="vectorized")
+    parser.add_argument("--max-error", type=float, default=0.03,
+                        help="allowed mean absolute error of the win probability (default 0.03)")
+    args = parser.parse_args()
+
+    simulator = HockeyGameSimulator(seed=args.seed)
+    simulator.create_league()
+    teams = simulator.teams
+    rng = random.Random(args.seed)
+    pairs = [tuple(rng.sample(range(len(teams)), 2)) for _ in range(args.pairs)]
+
+    simulator.matchup_odds()  # warm-up
+    start = time.perf_counter()
+    odds = simulator.matchup_odds()
+    analytical_time = time.perf_counter() - start
+
+    errors = {name: [] for name in METRICS}
+    start = time.perf_counter()
+    for pair_number, (index1, index2) in enumerate(pairs):
+        seed = args.seed * 1000 + pair_number
+        if args.engine == "scalar":
+            simulated = scalar_rates(teams, index1, index2, args.games, seed)
+        else:
+            simulated = vectorized_rates(teams, index1, index2, args.games, seed)
+        predicted = odds.pair(teams[index1], teams[index2])
+        for name in METRICS:
+            errors[name].append(abs(predicted[name] - simulated[name]))
+    monte_carlo_time = time.perf_counter() - start
+
+    print(f"Analytical: {len(teams) ** 2} matchups in {analytical_time * 1000:.1f} ms. "
+          f"Monte Carlo ({args.engine}): {len(pairs)} matchups x {args.games} games "
+          f"in {monte_carlo_time:.1f} s.")
+    # Sampling noise alone gives a standard error of up to 0.5 / sqrt(games) per rate.
+    print(f"Monte Carlo standard error per rate: <= {0.5 / args.games ** 0.5:.4f}")
+    print(f"{'metric':<12}{'mean |err|':>12}{'max |err|':>11}")
+    for name in METRICS:
+        print(f"{name:<12}{sum(errors[name]) / len(pairs):>12.4f}{max(errors[name]):>11.4f}")
+    mean_error = sum(errors["team1_win"]) / len(pairs)
+    if mean_error > args.max_error:
+        print(f"FAIL: mean win-probability error {mean_error:.4f} exceeds {args.max_error}.")
+        sys.exit(1)
+    print("OK: analytical odds agree with the Monte Carlo engine.")
+
+
+if __name__ == "__main__":
+    main()
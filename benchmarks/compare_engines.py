@@ -0,0 +1,105 @@
+"""
+Statistical equivalence check between the scalar engine (the reference) and the
+vectorized NumPy engine.
+
+Both engines play the same matchups, every game starting from the same league
+snapshot, and the script compares per-game outcome distributions with two-sample
+z-scores. It exits with status 1 if any metric differs by more than --max-z
+standard errors.
+
+    python benchmarks/compare_engines.py --games 4000 --seed 1
+"""
+import argparse
+import math
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from newHockeyGameSimulator import DECISIONS, HockeyGameSimulator, VectorizedEngine  # noqa: E402
+
+
+def summarize(samples):
+    mean = sum(samples) / len(samples)
+    variance = sum((x - mean) ** 2 for x in samples) / max(1, len(samples) - 1)
+    return mean, variance
+
+
+def z_score(a, b):
+    (mean_a, var_a), (mean_b, var_b) = summarize(a), summarize(b)
+    se = math.sqrt(var_a / len(a) + var_b / len(b))
+    return (mean_a - mean_b) / se if se else 0.0
+
+
+def scalar_metrics(league, pairs, seed):
+    simulator = HockeyGameSimulator(seed=seed)
+    metrics = {"goals1": [], "goals2": [], "team1_win": [], "injuries": []}
+    metrics.update({name: [] for name in DECISIONS})
+    for index1, index2 in pairs:
+        # Fresh copy of the snapshot so every game starts from the same state.
+        teams = pickle.loads(league)
+        simulator.adopt_teams(teams)
+        team1, team2 = teams[index1], teams[index2]
+        result = simulator.simulate_game(team1, team2)
+        metrics["goals1"].append(result.score1)
+        metrics["goals2"].append(result.score2)
+        metrics["team1_win"].append(int(result.score1 > result.score2))
+        metrics["injuries"].append(len(result.injuries))
+        for name in DECISIONS:
+            metrics[name].append(int(result.decision == name))
+    return metrics
+
+
+def vectorized_metrics(league, pairs, seed):
+    teams = pickle.loads(league)
+    batch = VectorizedEngine(seed=seed).simulate([(teams[i], teams[j]) for i, j in pairs])
+    metrics = {
+        "goals1": batch.score1.tolist(),
+        "goals2": batch.score2.tolist(),
+        "team1_win": (batch.score1 > batch.score2).astype(int).tolist(),
+        "injuries": batch.injuries.sum(axis=1).tolist(),
+    }
+    for code, name in enumerate(DECISIONS):
+        metrics[name] = (batch.decision == code).astype(int).tolist()
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=4000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-z", type=float, default=4.0)
+    args = parser.parse_args()
+
+    simulator = HockeyGameSimulator(seed=args.seed)
+    simulator.create_league()
+    league = pickle.dumps(simulator.teams)
+    num_teams = len(simulator.teams)
+    pairs = [(i % num_teams, (i * 7 + 1) % num_teams) for i in range(args.games)]
+    pairs = [(i, j) for i, j in pairs if i != j]
+
+    start = time.perf_counter()
+    scalar = scalar_metrics(league, pairs, args.seed)
+    scalar_time = time.perf_counter() - start
+    start = time.perf_counter()
+    vectorized = vectorized_metrics(league, pairs, args.seed)
+    vectorized_time = time.perf_counter() - start
+
+    print(f"{len(pairs)} games: scalar {len(pairs) / scalar_time:,.0f} games/sec, "
+          f"vectorized {len(pairs) / vectorized_time:,.0f} games/sec")
+    print(f"{'metric':<12}{'scalar':>10}{'vectorized':>12}{'z':>8}")
+    failed = False
+    for name in scalar:
+        z = z_score(scalar[name], vectorized[name])
+        failed |= abs(z) > args.max_z
+        print(f"{name:<12}{summarize(scalar[name])[0]:>10.4f}{summarize(vectorized[name])[0]:>12.4f}{z:>8.2f}")
+    if failed:
+        print(f"FAIL: at least one metric differs by more than {args.max_z} standard errors.")
+        sys.exit(1)
+    print("OK: engines are statistically equivalent on every metric.")
+
+
+if __name__ == "__main__":
+    main()
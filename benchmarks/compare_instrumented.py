@@ -0,0 +1,71 @@
+"""
+Exact-match check between the plain game engine and its instrumented copy.
+
+enable_stats() switches the simulator to _simulate_team_iteration_instrumented,
+which calls the plain engine's step methods with counters and timers around them. The script plays the same seeded season twice, once
+with stats off and once with them on, and compares every game (score, decision,
+goals, injuries) and the final team and player statistics. Any difference means
+the two copies have drifted apart; the script then exits with status 1.
+
+    python benchmarks/compare_instrumented.py --seasons 3 --games-per-team 82
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from newHockeyGameSimulator import TEAM_STAT_FIELDS, HockeyGameSimulator  # noqa: E402
+
+
+def play_season(seed, games_per_team, instrumented):
+    simulator = HockeyGameSimulator(seed=seed)
+    simulator.create_league()
+    if instrumented:
+        simulator.enable_stats()
+    schedule = simulator.build_schedule(games_per_team)
+    results = simulator.simulate_season(schedule)
+    games = [(str(r.team1), str(r.team2), r.score1, r.score2, r.decision,
+              [(g.period, str(g.team), g.player.jersey_number) for g in r.goals],
+              [(i.period, str(i.team), i.player.jersey_number) for i in r.injuries])
+             for r in results]
+    teams = [(str(team), [getattr(team, field) for field in TEAM_STAT_FIELDS],
+              [(p.jersey_number, p.goals_scored, p.energy, p.injured) for p in team.players])
+             for team in simulator.teams]
+    return games, teams, simulator.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=3, help="seeded seasons to compare")
+    parser.add_argument("--games-per-team", type=int, default=82)
+    parser.add_argument("--seed", type=int, default=1, help="seed of the first season")
+    args = parser.parse_args()
+
+    failed = False
+    for seed in range(args.seed, args.seed + args.seasons):
+        start = time.perf_counter()
+        plain_games, plain_teams, _ = play_season(seed, args.games_per_team, instrumented=False)
+        stats_games, stats_teams, stats = play_season(seed, args.games_per_team, instrumented=True)
+        elapsed = time.perf_counter() - start
+        mismatch = next((index for index, (a, b) in enumerate(zip(plain_games, stats_games)) if a != b), None)
+        if mismatch is not None:
+            print(f"seed {seed}: FAIL, game {mismatch + 1} differs:\n  plain {plain_games[mismatch]}\n"
+                  f"  stats {stats_games[mismatch]}")
+            failed = True
+        elif plain_teams != stats_teams or len(plain_games) != len(stats_games):
+            print(f"seed {seed}: FAIL, final team or player statistics differ")
+            failed = True
+        else:
+            print(f"seed {seed}: {len(plain_games)} games identical "
+                  f"({stats.counters['goals']} goals, {stats.counters['line_changes']} line changes) "
+                  f"in {elapsed:.1f}s")
+    if failed:
+        print("FAIL: the instrumented engine no longer matches the plain engine.")
+        sys.exit(1)
+    print("OK: enabling stats leaves every seeded result unchanged.")
+
+
+if __name__ == "__main__":
+    main()
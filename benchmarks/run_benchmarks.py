@@ -0,0 +1,189 @@
+"""
+Benchmark suite for the simulator's hot paths.
+
+Times simulate_game, simulate_period, _simulate_team_iteration, simulate_shootout,
+Team.generate_team, create_league (lazy rosters), a cold first game (new simulator,
+league and one game) and (with NumPy) the analytical matchup_odds matrix with fixed
+seeds and no reporter (no output), then measures each one's peak memory with
+tracemalloc in a separate pass so tracing does not skew the timings.
+
+Results can be saved as JSON and compared with a stored baseline; any benchmark more
+than --tolerance slower than the baseline is reported and the script exits with 1.
+
+    python benchmarks/run_benchmarks.py                      # run and compare with baseline.json
+    python benchmarks/run_benchmarks.py --save results.json
+    python benchmarks/run_benchmarks.py --update-baseline    # accept current numbers
+"""
+import argparse
+import json
+import os
+import pickle
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, ".."))
+
+from newHockeyGameSimulator import HockeyGameSimulator, Team  # noqa: E402
+
+try:
+    import numpy  # the simulator loads NumPy lazily; only needed to decide on matchup_odds
+except ImportError:
+    numpy = None
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+SEED = 1
+
+
+def league_snapshot() -> bytes:
+    simulator = HockeyGameSimulator(seed=SEED)
+    simulator.create_league()
+    return pickle.dumps(simulator.teams)
+
+
+def fresh_simulator(league: bytes) -> HockeyGameSimulator:
+    simulator = HockeyGameSimulator(seed=SEED)
+    simulator.adopt_teams(pickle.loads(league))
+    for team in simulator.teams:
+        team.current_line = team.lines[0]
+        team._initial_update_active_goaltender()
+    return simulator
+
+
+# Each benchmark factory takes the league snapshot and returns (callable, unit). The
+# callable is timed as one call; unit names what a call produces, for the report.
+def bench_simulate_game(league):
+    simulator = fresh_simulator(league)
+    teams = simulator.teams
+    state = {"i": 0}
+
+    def run():
+        i = state["i"] = state["i"] + 1
+        simulator.simulate_game(teams[i % len(teams)], teams[(i + 1) % len(teams)])
+    return run, "games"
+
+
+def bench_simulate_period(league):
+    simulator = fresh_simulator(league)
+    team1, team2 = simulator.teams[0], simulator.teams[1]
+    return (lambda: simulator.simulate_period(team1, team2, 2)), "periods"
+
+
+def bench_team_iteration(league):
+    simulator = fresh_simulator(league)
+    team1, team2 = simulator.teams[0], simulator.teams[1]
+    return (lambda: simulator._simulate_team_iteration(team1, team2, 2)), "iterations"
+
+
+def bench_simulate_shootout(league):
+    simulator = fresh_simulator(league)
+    team1, team2 = simulator.teams[0], simulator.teams[1]
+    return (lambda: simulator.simulate_shootout(team1, team2)), "shootouts"
+
+
+def bench_generate_team(league):
+    rng = random.Random(SEED)
+    return (lambda: Team("Bench", "Mark", rng).generate_team()), "teams"
+
+
+def bench_create_league(league):
+    return (lambda: HockeyGameSimulator(seed=SEED).create_league()), "leagues"
+
+
+def bench_first_game(league):
+    def run():
+        simulator = HockeyGameSimulator(seed=SEED)
+        simulator.create_league()
+        simulator.simulate_game(simulator.teams[0], simulator.teams[1])
+    return run, "games"
+
+
+def bench_matchup_odds(league):
+    simulator = fresh_simulator(league)
+    return (lambda: simulator.matchup_odds()), "matrices"
+
+
+BENCHMARKS = {
+    "simulate_game": (bench_simulate_game, 300),
+    "simulate_period": (bench_simulate_period, 1000),
+    "_simulate_team_iteration": (bench_team_iteration, 20000),
+    "simulate_shootout": (bench_simulate_shootout, 5000),
+    "generate_team": (bench_generate_team, 1000),
+    "create_league": (bench_create_league, 50),
+    "first_game": (bench_first_game, 50),
+}
+if numpy is not None:
+    BENCHMARKS["matchup_odds"] = (bench_matchup_odds, 20)
+
+
+def run_benchmark(name, league, repeat):
+    factory, number = BENCHMARKS[name]
+    func, unit = factory(league)
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+    # Peak memory for the same workload, measured in its own traced pass.
+    func, _ = factory(league)
+    tracemalloc.start()
+    for _ in range(number):
+        func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"unit": unit, "us_per_call": best * 1e6, "per_sec": 1 / best, "peak_kib": peak / 1024}
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    print(f"\n{'benchmark':<26}{'baseline us':>13}{'current us':>12}{'change':>9}")
+    for name, current in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            print(f"{name:<26}{'-':>13}{current['us_per_call']:>12.1f}{'new':>9}")
+            continue
+        change = current["us_per_call"] / previous["us_per_call"] - 1
+        flag = "  SLOWER" if change > tolerance else ""
+        print(f"{name:<26}{previous['us_per_call']:>13.1f}{current['us_per_call']:>12.1f}{change:>+9.1%}{flag}")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats; the best is kept")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run a subset")
+    parser.add_argument("--save", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before a benchmark counts as a regression (default 0.25)")
+    args = parser.parse_args()
+
+    league = league_snapshot()
+    results = {"python": platform.python_version(), "machine": platform.machine(), "benchmarks": {}}
+    print(f"{'benchmark':<26}{'us/call':>10}{'per sec':>12}  {'unit':<11}{'peak KiB':>9}")
+    for name in args.only or BENCHMARKS:
+        result = results["benchmarks"][name] = run_benchmark(name, league, args.repeat)
+        print(f"{name:<26}{result['us_per_call']:>10.1f}{result['per_sec']:>12,.0f}  "
+              f"{result['unit']:<11}{result['peak_kib']:>9.1f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"\nBaseline written to {args.baseline}")
+        return
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+        if regressions:
+            print(f"\nRegressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
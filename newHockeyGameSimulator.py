@@ -1,6 +1,40 @@
+import argparse
+import bisect
+import csv
+import gzip
+import heapq
+import itertools
+import json
+import math
+import operator
+import os
+import pickle
 import random
+import struct
 import sys
-from typing import List, Optional
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from contextlib import ExitStack
+from typing import Dict, Iterator, List, NamedTuple, Optional, Protocol, Sequence, TypeVar
+from urllib.parse import parse_qsl, urlsplit
+
+# NumPy is optional and only needed by the vectorized engine, the analytical odds and the
+# result store reader. Importing it takes longer than everything else in a cold start, so
+# it is loaded on first use by those (see _require_numpy); np stays None until then.
+np = None
+
+def _require_numpy(feature: str):
+    """Import NumPy on first use and return it; ImportError names the feature without it."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(f"{feature} requires NumPy (pip install numpy).") from None
+        np = numpy
+    return np
 
 # =============================================================================
 # Data Structure Justified:
@@ -20,7 +54,60 @@ from typing import List, Optional
 # Player, Line, and Team Classes
 # -----------------------------
 
+T = TypeVar("T")
+
+class RandomSource(Protocol):
+    """
+    The subset of random.Random the simulator draws from. A random.Random instance is
+    the usual choice; the random module itself also satisfies it.
+    """
+    def random(self) -> float: ...
+    def uniform(self, a: float, b: float) -> float: ...
+    def randint(self, a: int, b: int) -> int: ...
+    def choice(self, seq: Sequence[T]) -> T: ...
+    def sample(self, population: Sequence[T], k: int) -> List[T]: ...
+    def choices(self, population: Sequence[T], *, k: int = 1) -> List[T]: ...
+    def shuffle(self, x: List[T]) -> None: ...
+
+class SimulationConfig(NamedTuple):
+    """
+    Tunable constants of the game model. The defaults are the original rules; pass a
+    modified copy (config._replace(...)) to HockeyGameSimulator to play by other values,
+    e.g. when calibrating against real league averages with run_sweep.
+    """
+    iterations_per_period: int = 10
+    line_change_energy: float = 18      # a line below this average energy is changed
+    goalie_min_energy: float = 16       # goalies below this energy are swapped out
+    shooter_offense_factor: float = 0.75
+    energy_drain_min: float = 1.5       # energy an on-ice player loses per iteration,
+    energy_drain_max: float = 6         # drawn uniformly from [min, max]
+    # Injury chance per attack: (line energy * energy weight + period * period weight) / divisor.
+    injury_energy_weight: float = 0.5
+    injury_period_weight: float = 5
+    injury_divisor: float = 10000
+    injury_games_min: int = 10
+    injury_games_max: int = 40
+
+    def validate(self) -> None:
+        """Raise ValueError for values the engines cannot play with."""
+        if not isinstance(self.iterations_per_period, int) or self.iterations_per_period < 1:
+            raise ValueError("iterations_per_period must be a positive integer.")
+        if not 0 <= self.energy_drain_min <= self.energy_drain_max:
+            raise ValueError("energy_drain_min must be between 0 and energy_drain_max.")
+        if self.injury_divisor <= 0:
+            raise ValueError("injury_divisor must be positive.")
+        if not (isinstance(self.injury_games_min, int) and isinstance(self.injury_games_max, int)
+                and 0 <= self.injury_games_min <= self.injury_games_max):
+            raise ValueError("injury_games_min and injury_games_max must be integers with 0 <= min <= max.")
+
+DEFAULT_CONFIG = SimulationConfig()
+
 class Player:
+    # __slots__ drops the per-instance __dict__; leagues are copied thousands of times
+    # for parallel replicas, so the smaller objects add up.
+    __slots__ = ("jersey_number", "offensive_value", "defensive_value", "energy", "position",
+                 "injured", "injury_length", "goals_scored", "active")
+
     def __init__(self, jersey_number: int, offensive_value: int, defensive_value: int, 
                  energy: int, position: str):
         self.jersey_number = jersey_number
@@ -33,10 +120,11 @@ class Player:
         self.goals_scored = 0
         self.active = False  # track if player is in current line
 
-    def update_energy(self, is_active: bool) -> None:
+    def update_energy(self, is_active: bool, rng: RandomSource = random,
+                      config: SimulationConfig = DEFAULT_CONFIG) -> None:
         if is_active:
-            # Active players lose between 1.5 and 6 energy per iteration
-            self.energy = max(0, self.energy - random.uniform(1.5, 6))
+            # Active players lose between 1.5 and 6 energy per iteration (by default)
+            self.energy = max(0, self.energy - rng.uniform(config.energy_drain_min, config.energy_drain_max))
         else:
             # Inactive players gain 1 energy per iteration (up to max of 25)
             self.energy = min(25, self.energy + 1)
@@ -46,45 +134,178 @@ class Player:
                 f"Def: {self.defensive_value}, Energy: {self.energy:.1f}, "
                 f"Goals: {self.goals_scored}, Injured: {self.injured}")
 
+# sum(map(_player_energy, players)) adds the same values in the same order as a
+# generator expression, without running a Python frame per player.
+_player_energy = operator.attrgetter("energy")
+
 class Line:
+    __slots__ = ("players", "_offense_sum", "_defense_sum", "_energy_sum", "_offense_ranking")
+
     def __init__(self, players: List[Player]):
         # Using a list for players because the order matters (e.g., for line-up strategy)
         # and because lists allow efficient iteration and random sampling.
         self.players = players
+        # Running sums behind the average getters, so reading an average is O(1).
+        # Offense and defense only change when a player is swapped (replace_player);
+        # energy changes every iteration, so its sum is recomputed lazily after
+        # invalidate_energy() marks it stale (None).
+        self._offense_sum = sum(p.offensive_value for p in players)
+        self._defense_sum = sum(p.defensive_value for p in players)
+        self._energy_sum: Optional[float] = None
+        # Players ordered by offensive value (best first). Ratings only change when a
+        # player is swapped, so the ordering is built once and reused for every shot.
+        self._offense_ranking: Optional[List[Player]] = None
+
+    def invalidate_energy(self) -> None:
+        self._energy_sum = None
+
+    def invalidate(self) -> None:
+        # Call after changing self.players or player ratings directly.
+        self._offense_sum = sum(p.offensive_value for p in self.players)
+        self._defense_sum = sum(p.defensive_value for p in self.players)
+        self._energy_sum = None
+        self._offense_ranking = None
+
+    def replace_player(self, old: Player, new: Player) -> None:
+        # The newcomer joins at the end of the line, as the original roster code did.
+        self.players.remove(old)
+        self.players.append(new)
+        self._offense_sum += new.offensive_value - old.offensive_value
+        self._defense_sum += new.defensive_value - old.defensive_value
+        self._energy_sum = None
+        self._offense_ranking = None
 
     def get_average_energy(self) -> float:
-        return sum(p.energy for p in self.players) / len(self.players)
+        energy_sum = self._energy_sum
+        if energy_sum is None:
+            energy_sum = self._energy_sum = sum(map(_player_energy, self.players))
+        return energy_sum / len(self.players)
     
     def get_average_offensive_value(self) -> float:
-        return sum(p.offensive_value for p in self.players) / len(self.players)
+        return self._offense_sum / len(self.players)
     
     def get_average_defensive_value(self) -> float:
-        return sum(p.defensive_value for p in self.players) / len(self.players)
+        return self._defense_sum / len(self.players)
     
     def get_top_offensive_players(self, count: int = 3) -> List[Player]:
-        # Sorting returns a new list. We use a list here since we need an ordered collection
-        # of the top players to randomly choose a shooter.
-        return sorted(self.players, key=lambda p: p.offensive_value, reverse=True)[:count]
+        # We use a list here since we need an ordered collection of the top players to
+        # randomly choose a shooter. The full ranking is cached; only the slice is new.
+        ranking = self._offense_ranking
+        if ranking is None:
+            ranking = self._offense_ranking = sorted(self.players, key=lambda p: p.offensive_value,
+                                                     reverse=True)
+        return ranking[:count]
     
     def get_lowest_energy_players(self, count: int = 3) -> List[Player]:
-        # Again, we use a list here to have an ordered collection of players with the lowest energy.
-        return sorted(self.players, key=lambda p: p.energy)[:count]
+        # Energies change every iteration, so there is nothing to cache; heapq.nsmallest
+        # selects the few lowest without sorting the whole line (same order as a sort).
+        return heapq.nsmallest(count, self.players, key=lambda p: p.energy)
+
+class JerseyPool:
+    """
+    Free jersey numbers for one team. acquire() hands out a random free number in O(1)
+    and release() returns a number to the pool when its player leaves the roster.
+    """
+    __slots__ = ("_free", "_position")
+    # Fresh (free, position) arrays per number range; a new pool copies them, which is
+    # much cheaper than building arrays from ranges for every roster.
+    _TEMPLATES: Dict[tuple, tuple] = {}
+
+    def __init__(self, low: int = 1, high: int = 99):
+        # Free numbers in a compact array support O(1) random picks. The position table,
+        # indexed by jersey number, holds each free number's place in that array (-1 once
+        # taken), so any number can be removed in O(1) too. Signed bytes are enough for
+        # numbers and positions up to 127 and keep a pool to about 200 bytes, where a
+        # list plus a dictionary of ints cost several kilobytes per team.
+        templates = JerseyPool._TEMPLATES.get((low, high))
+        if templates is None:
+            if not 0 <= low <= high <= 127:
+                raise ValueError("Jersey numbers must lie between 0 and 127.")
+            templates = JerseyPool._TEMPLATES[low, high] = (
+                array("b", range(low, high + 1)), array("b", [-1] * low + list(range(high - low + 1))))
+        self._free, self._position = templates[0][:], templates[1][:]
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def __contains__(self, number: int) -> bool:
+        return 0 <= number < len(self._position) and self._position[number] >= 0
+
+    def acquire(self, rng: RandomSource) -> int:
+        if not self._free:
+            raise RuntimeError("No free jersey numbers left on this roster.")
+        return self._take(rng.randint(0, len(self._free) - 1))
+
+    def acquire_many(self, rng: RandomSource, count: int) -> List[int]:
+        # One sample() call for a whole roster instead of one draw per player.
+        numbers = rng.sample(self._free, count)
+        for number in numbers:
+            self._take(self._position[number])
+        return numbers
+
+    def reserve(self, number: int) -> None:
+        # Mark a specific number as used (e.g. a player added to the roster by hand).
+        if number not in self:
+            raise ValueError(f"Jersey number {number} is not available.")
+        self._take(self._position[number])
+
+    def release(self, number: int) -> None:
+        if number not in self:
+            self._position[number] = len(self._free)
+            self._free.append(number)
+
+    def _take(self, position: int) -> int:
+        # Swap the chosen number with the last one so removal is a pop from the end.
+        free, table = self._free, self._position
+        number, last = free[position], free[-1]
+        free[position] = last
+        table[last] = position
+        free.pop()
+        table[number] = -1
+        return number
 
 class Team:
-    def __init__(self, city: str, name: str):
+    __slots__ = ("city", "name", "rng", "jerseys", "players", "goaltenders", "lines", "_current_line",
+                 "active_goaltender", "games_played", "regular_wins", "overtime_wins",
+                 "shootout_wins", "regular_losses", "overtime_losses", "shootout_losses",
+                 "goals_for", "goals_against", "injuries", "injured_reserve", "call_ups",
+                 "_shootout_odds", "_fingerprint", "_roster_seed", "config")
+    # Emergency goalies are added when nobody can play; the list is trimmed back to this.
+    MAX_GOALTENDERS = 3
+    # Slots left unset by a lazy team until its roster is generated (see __getattr__).
+    ROSTER_SLOTS = frozenset(("jerseys", "players", "goaltenders", "lines", "_current_line",
+                              "active_goaltender"))
+    # Rating ranges for generated rosters (inclusive, as randint draws them).
+    SKATER_RATINGS = range(50, 101)
+    GOALIE_RATINGS = range(60, 91)
+    START_ENERGY = range(1, 26)
+
+    def __init__(self, city: str, name: str, rng: Optional[RandomSource] = None,
+                 roster_seed: Optional[str] = None, config: SimulationConfig = DEFAULT_CONFIG):
         self.city = city
         self.name = name
-        
-        # Using lists to store collections of players and goaltenders.
-        # Lists maintain insertion order, which is useful for iterating and managing team rosters.
-        self.players: List[Player] = []      # all skaters
-        self.goaltenders: List[Player] = []    # list of goaltenders
-        
-        # Using a list for lines allows us to maintain the order of the lines
-        # (which might be important for simulating game strategies) and facilitates random selection.
-        self.lines: List[Line] = []            # list of 4 lines (each with 5 players)
-        self.current_line: Optional[Line] = None
-        self.active_goaltender: Optional[Player] = None
+        # Every random draw for this team (injuries, energy, call-ups) comes from this
+        # generator, so a seeded generator makes the team fully reproducible.
+        self.rng: RandomSource = rng if rng is not None else random.Random()
+        # Model constants for energy, goalie swaps and injuries; shared with the simulator
+        # that plays this team, like rng (see HockeyGameSimulator.adopt_teams).
+        self.config = config
+        # With a roster seed the roster is generated from its own generator on first use
+        # instead of here, so it does not depend on when (or whether) other teams are built.
+        self._roster_seed = roster_seed
+        if roster_seed is None:
+            self._clear_roster()
+        # Injured regulars waiting to return; each one's injury_length counts the games
+        # still to miss. They keep their jersey numbers while they are out.
+        self.injured_reserve: List[Player] = []
+        # The call-up covering for each injured regular, keyed by the regular's jersey
+        # number (numbers are unique on a roster and survive pickling, unlike ids).
+        self.call_ups: Dict[int, Player] = {}
+        # Shootout scoring probability per opposing goalie defensive value; see
+        # shootout_scoring_probability. Cleared whenever the skater roster changes.
+        self._shootout_odds: Dict[int, float] = {}
+        # Memoized result of fingerprint(); None until asked for and after any change.
+        self._fingerprint: Optional[tuple] = None
         
         # Statistics (simple integers suffice for counting game stats)
         self.games_played = 0
@@ -98,29 +319,58 @@ class Team:
         self.goals_against = 0
         self.injuries = 0
 
-    def generate_team(self) -> None:
+    def _clear_roster(self) -> None:
+        self.jerseys = JerseyPool()
+        
+        # Using lists to store collections of players and goaltenders.
+        # Lists maintain insertion order, which is useful for iterating and managing team rosters.
+        self.players: List[Player] = []      # all skaters
+        self.goaltenders: List[Player] = []    # list of goaltenders
+        
+        # Using a list for lines allows us to maintain the order of the lines
+        # (which might be important for simulating game strategies) and facilitates random selection.
+        self.lines: List[Line] = []            # list of 4 lines (each with 5 players)
+        self._current_line: Optional[Line] = None
+        self.active_goaltender: Optional[Player] = None
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set: the roster slots of a lazy team
+        # are filled from its roster seed the first time anything reads one of them.
+        if name in Team.ROSTER_SLOTS and getattr(self, "_roster_seed", None) is not None:
+            seed, self._roster_seed = self._roster_seed, None
+            self._clear_roster()
+            self.generate_team(random.Random(seed))
+            return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def materialized(self) -> bool:
+        """False while a lazily created team's roster is still ungenerated."""
+        return self._roster_seed is None
+
+    def generate_team(self, rng: Optional[RandomSource] = None) -> None:
+        # The whole roster is drawn in a few batched calls (one sample for the jersey
+        # numbers, one choices() per rating column) rather than one randint per value.
+        rng = rng if rng is not None else self.rng
+        jerseys = self.jerseys.acquire_many(rng, 20)
+        skater_ratings = rng.choices(self.SKATER_RATINGS, k=36)
+        goalie_ratings = rng.choices(self.GOALIE_RATINGS, k=2)
+        energies = rng.choices(self.START_ENERGY, k=20)
+
         # Create 18 skaters and add them to the players list.
-        for _ in range(18):
-            self.players.append(Player(
-                jersey_number=self._generate_unique_number(),
-                offensive_value=random.randint(50, 100),
-                defensive_value=random.randint(50, 100),
-                energy=random.randint(1, 25),
-                position="Skater"
-            ))
+        for i in range(18):
+            self.players.append(Player(jersey_number=jerseys[i], offensive_value=skater_ratings[i],
+                                       defensive_value=skater_ratings[18 + i], energy=energies[i],
+                                       position="Skater"))
 
         # Create 2 goaltenders and add them to the goaltenders list.
-        for _ in range(2):
-            self.goaltenders.append(Player(
-                jersey_number=self._generate_unique_number(),
-                offensive_value=0,
-                defensive_value=random.randint(60, 90),
-                energy=random.randint(1, 25),
-                position="Goaltender"
-            ))
+        for i in range(2):
+            self.goaltenders.append(Player(jersey_number=jerseys[18 + i], offensive_value=0,
+                                           defensive_value=goalie_ratings[i], energy=energies[18 + i],
+                                           position="Goaltender"))
 
         # Create 4 lines (each with 5 skaters) using lists to store each line.
-        self._generate_lines()
+        self._generate_lines(rng)
         
         # Set starting active goaltender (highest defensive value)
         self._initial_update_active_goaltender()
@@ -128,21 +378,18 @@ class Team:
         self.current_line = self.lines[0]
 
     def _generate_unique_number(self) -> int:
-        # Combining players and goaltenders into one list and using a set comprehension to quickly
-        # check for uniqueness. A set is ideal here because it provides O(1) membership testing.
-        used_numbers = {p.jersey_number for p in self.players + self.goaltenders}
-        while True:
-            num = random.randint(1, 99)
-            if num not in used_numbers:
-                return num
+        # The team's jersey pool only holds numbers nobody on the roster wears, so a
+        # single draw is always unique. Raises RuntimeError once all 99 are taken.
+        return self.jerseys.acquire(self.rng)
 
-    def _generate_lines(self) -> None:
+    def _generate_lines(self, rng: Optional[RandomSource] = None) -> None:
+        rng = rng if rng is not None else self.rng
         # Reset lines as an empty list before generating new lines.
         self.lines = []
         available_players = self.players.copy()  # Copying the list to avoid modifying the original roster.
         # For each line, randomly sample 5 players. The list structure allows for random sampling.
         for _ in range(4):
-            line_players = random.sample(available_players, 5)
+            line_players = rng.sample(available_players, 5)
             self.lines.append(Line(line_players))
 
     def _initial_update_active_goaltender(self) -> None:
@@ -155,24 +402,26 @@ class Team:
             new_goalie = Player(
                 jersey_number=self._generate_unique_number(),
                 offensive_value=0,
-                defensive_value=random.randint(50, 80),  # emergency goalie: reduced stats
+                defensive_value=self.rng.randint(50, 80),  # emergency goalie: reduced stats
                 energy=25,
                 position="Goaltender"
             )
             self.goaltenders.append(new_goalie)
             self.active_goaltender = new_goalie
+        self._fingerprint = None
 
     def update_active_goaltender(self) -> None:
         """
         The active goaltender should always be the best available (highest defensive value)
-        among non-injured goalies whose energy is at least 16.
-        If the current active goalie is injured or has energy lower than 16, switch.
+        among non-injured goalies whose energy is at least config.goalie_min_energy (16).
+        If the current active goalie is injured or has energy lower than that, switch.
         If no valid goalie exists, generate an emergency goalie.
         """
+        min_energy = self.config.goalie_min_energy
         if (self.active_goaltender is None or 
             self.active_goaltender.injured or 
-            self.active_goaltender.energy < 16):
-            candidates = [g for g in self.goaltenders if not g.injured and g.energy >= 16]
+            self.active_goaltender.energy < min_energy):
+            candidates = [g for g in self.goaltenders if not g.injured and g.energy >= min_energy]
             if candidates:
                 self.active_goaltender = max(candidates, key=lambda g: g.defensive_value)
             else:
@@ -180,77 +429,836 @@ class Team:
                 new_goalie = Player(
                     jersey_number=self._generate_unique_number(),
                     offensive_value=0,
-                    defensive_value=random.randint(50, 80),
+                    defensive_value=self.rng.randint(50, 80),
                     energy=25,
                     position="Goaltender"
                 )
                 self.goaltenders.append(new_goalie)
                 self.active_goaltender = new_goalie
+            self._fingerprint = None
+
+    @property
+    def current_line(self) -> Optional[Line]:
+        return self._current_line
+
+    @current_line.setter
+    def current_line(self, line: Optional[Line]) -> None:
+        # Keep Player.active in sync with the line on the ice, so membership checks are
+        # a flag read instead of a scan of the line's player list. Lines can share
+        # players, so the old line is cleared before the new one is marked.
+        if self._current_line is not None:
+            for player in self._current_line.players:
+                player.active = False
+        if line is not None:
+            for player in line.players:
+                player.active = True
+        self._current_line = line
 
     def update_line_energy(self) -> None:
-        if self.current_line:
+        """
+        Bulk version of Player.update_energy for the whole roster: on-ice players lose
+        1.5-6 energy (the config's drain range), everyone else recovers 1 (capped at 25).
+        The drain is written out as low + (high - low) * random(), which is exactly how
+        rng.uniform(low, high) computes it, so the random stream is unchanged while the
+        loop skips a method call per player.
+        """
+        if self._current_line:
+            rand = self.rng.random
+            low = self.config.energy_drain_min
+            spread = self.config.energy_drain_max - low
             for player in self.players:
-                player.update_energy(player in self.current_line.players)
+                if player.active:
+                    energy = player.energy - (low + spread * rand())
+                    player.energy = energy if energy > 0 else 0
+                else:
+                    energy = player.energy + 1
+                    player.energy = energy if energy < 25 else 25
+            for line in self.lines:
+                line._energy_sum = None  # inlined invalidate_energy()
+            self._fingerprint = None
 
     def select_best_line(self) -> None:
         """
-        If the current line’s average energy is lower than 18, select the line 
-        (from those with no injured players) that has the highest average energy.
+        If the current line’s average energy is lower than 18 (config.line_change_energy), select the line
+        that has the highest average energy.
         """
-        available_lines = [line for line in self.lines if not any(p.injured for p in line.players)]
-        if not available_lines:
-            self._generate_lines()
-            available_lines = self.lines
-
-        best_line = max(available_lines, key=lambda l: l.get_average_energy())
-        if self.current_line != best_line:
+        # No line ever holds an injured player: _replace_injured_player swaps him out of
+        # every line at once and _return_from_injury clears the flag before he is put
+        # back, so all lines are available without scanning them.
+        best_line = max(self.lines, key=Line.get_average_energy)
+        if self._current_line is not best_line:
             self.current_line = best_line
 
-    def handle_injury(self, period: int) -> bool:
+    def handle_injury(self, period: int) -> Optional[Player]:
         """
-        Injury probability: (Avg Energy of Current Line * 0.5 + period * 5) / 10000.
+        Injury probability: (Avg Energy of Current Line * 0.5 + period * 5) / 10000, with the
+        weights and divisor taken from the config.
         If an injury occurs, pick a random player among the 3 with lowest energy in current line,
-        mark injured (with injury_length between 10 and 40) and replace him with a new skater.
+        mark injured (with injury_length between 10 and 40 games by default) and replace him
+        with a new skater.
+        A regular goes on injured reserve until maintain_roster() brings him back; an
+        injured call-up is released instead. Returns the injured player, or None.
         """
-        if not self.current_line:
-            return False
+        line = self._current_line
+        if not line:
+            return None
 
-        injury_prob = (self.current_line.get_average_energy() * 0.5 + period * 5) / 10000
-        if random.random() <= injury_prob:
-            candidates = self.current_line.get_lowest_energy_players(3)
-            injured_player = random.choice(candidates)
+        config = self.config
+        injury_prob = (line.get_average_energy() * config.injury_energy_weight +
+                       period * config.injury_period_weight) / config.injury_divisor
+        if self.rng.random() <= injury_prob:
+            candidates = line.get_lowest_energy_players(3)
+            injured_player = self.rng.choice(candidates)
             injured_player.injured = True
-            injured_player.injury_length = random.randint(10, 40)
+            injured_player.injury_length = self.rng.randint(config.injury_games_min, config.injury_games_max)
             self._replace_injured_player(injured_player)
             self.injuries += 1
-            return True
-        return False
+            return injured_player
+        return None
 
     def _replace_injured_player(self, injured_player: Player) -> None:
         replacement = Player(
             jersey_number=self._generate_unique_number(),
-            offensive_value=random.randint(40, 60),  # per instructions for replacement
-            defensive_value=random.randint(50, 100),
-            energy=random.randint(1, 25),
+            offensive_value=self.rng.randint(40, 60),  # per instructions for replacement
+            defensive_value=self.rng.randint(50, 100),
+            energy=self.rng.randint(1, 25),
             position="Skater"
         )
         if injured_player in self.players:
             self.players.remove(injured_player)
             self.players.append(replacement)
+            covering_for = next((jersey for jersey, call_up in self.call_ups.items()
+                                 if call_up is injured_player), None)
+            if covering_for is None:
+                # A regular keeps his number on injured reserve and gets his spot back later.
+                self.injured_reserve.append(injured_player)
+                self.call_ups[injured_player.jersey_number] = replacement
+            else:
+                # A call-up who gets hurt is let go and his number is free again; the new
+                # call-up covers for the same injured regular.
+                self.call_ups[covering_for] = replacement
+                self.jerseys.release(injured_player.jersey_number)
+        # The replacement takes the injured player's spot on the ice if he was out there.
+        replacement.active = injured_player.active
+        injured_player.active = False
         for line in self.lines:
             if injured_player in line.players:
-                line.players.remove(injured_player)
-                line.players.append(replacement)
+                line.replace_player(injured_player, replacement)
+        self._shootout_odds.clear()
+        self._fingerprint = None
+
+    def maintain_roster(self) -> List[Player]:
+        """
+        Per-game roster upkeep, run before each of the team's games. Players on injured
+        reserve either sit out this game (one game off their injury_length) or, once it
+        reaches 0, return fully rested in place of their call-up, who is released. The
+        goalie list is trimmed to MAX_GOALTENDERS. Returns the players who came back.
+        """
+        returned: List[Player] = []
+        if self.injured_reserve:
+            still_out: List[Player] = []
+            for player in self.injured_reserve:
+                if player.injury_length > 0:
+                    player.injury_length -= 1
+                    still_out.append(player)
+                else:
+                    self._return_from_injury(player)
+                    returned.append(player)
+            self.injured_reserve = still_out
+        if len(self.goaltenders) > self.MAX_GOALTENDERS:
+            self._trim_goaltenders()
+        return returned
+
+    def _return_from_injury(self, player: Player) -> None:
+        call_up = self.call_ups.pop(player.jersey_number)
+        player.injured = False
+        player.energy = 25
+        # The regular takes back the call-up's roster slot, lines and place on the ice.
+        self.players[self.players.index(call_up)] = player
+        player.active = call_up.active
+        call_up.active = False
+        for line in self.lines:
+            if call_up in line.players:
+                line.replace_player(call_up, player)
+        self.jerseys.release(call_up.jersey_number)
+        self._shootout_odds.clear()
+        self._fingerprint = None
+
+    def _trim_goaltenders(self) -> None:
+        # Release the least useful spares first: goalies who cannot play (injured or below
+        # the energy cutoff), then the lowest rated. The active goalie always stays.
+        spares = sorted((g for g in self.goaltenders if g is not self.active_goaltender),
+                        key=lambda g: (not g.injured and g.energy >= self.config.goalie_min_energy,
+                                       g.defensive_value))
+        for goalie in spares[:len(self.goaltenders) - self.MAX_GOALTENDERS]:
+            self.goaltenders.remove(goalie)
+            self.jerseys.release(goalie.jersey_number)
+        self._fingerprint = None
+
+    def shootout_scoring_probability(self, goalie_defense: int) -> float:
+        """
+        Chance that one shootout attempt scores against a goalie with this defensive value.
+        A shooter drawn uniformly from the healthy skaters scores exactly when his offensive
+        value beats the goalie's defense, so the chance is the share of skaters who can.
+        Cached per goalie defense until the roster changes.
+        """
+        odds = self._shootout_odds.get(goalie_defense)
+        if odds is None:
+            pool = [p.offensive_value for p in self.players if p.position == "Skater" and not p.injured]
+            odds = sum(1 for value in pool if value > goalie_defense) / len(pool)
+            self._shootout_odds[goalie_defense] = odds
+        return odds
+
+    def fingerprint(self) -> tuple:
+        """
+        Hashable snapshot of everything matchup odds depend on: every skater's ratings,
+        energy and injury flag, the line compositions, the goalies and the active goalie.
+        Built once and reused until the team changes (a game, an injury replacement or
+        invalidate_fingerprint() after editing the roster by hand).
+        """
+        if self._fingerprint is None:
+            self._fingerprint = (
+                tuple((p.jersey_number, p.offensive_value, p.defensive_value, p.energy, p.injured)
+                      for p in self.players),
+                tuple(tuple(p.jersey_number for p in line.players) for line in self.lines),
+                tuple((g.jersey_number, g.defensive_value, g.energy, g.injured) for g in self.goaltenders),
+                self.active_goaltender.jersey_number if self.active_goaltender else None,
+            )
+        return self._fingerprint
+
+    def invalidate_fingerprint(self) -> None:
+        self._fingerprint = None
+
+    @property
+    def wins(self) -> int:
+        return self.regular_wins + self.overtime_wins + self.shootout_wins
+
+    @property
+    def points(self) -> int:
+        # 2 points for any win, 1 point for an overtime or shootout loss.
+        return 2 * self.wins + self.overtime_losses + self.shootout_losses
+
+    @property
+    def goal_differential(self) -> int:
+        return self.goals_for - self.goals_against
 
     def __repr__(self):
         return f"{self.city} {self.name}"
 
+# -----------------------------
+# Game Results and Reporters
+# -----------------------------
+
+# Ways a game can be decided. Where a compact code is needed (vectorized engine, event
+# log, result store) the index into this tuple is used.
+DECISIONS = ("regular", "overtime", "shootout")
+
+class Goal(NamedTuple):
+    # Named tuples are used for game events because each event is a fixed-size,
+    # immutable record that is created once and only ever read afterwards.
+    period: int
+    team: Team
+    player: Player
+
+class Injury(NamedTuple):
+    period: int
+    team: Team
+    player: Player
+
+class GameResult:
+    """
+    Structured outcome of a single game. The engine fills this in without any
+    string formatting; reporters decide how (and whether) to present it.
+    """
+    def __init__(self, team1: Team, team2: Team):
+        self.team1 = team1
+        self.team2 = team2
+        self.score1 = 0
+        self.score2 = 0
+        self.decision = "regular"
+        # Lists keep the events in the order they happened during the game.
+        self.goals: List[Goal] = []
+        self.injuries: List[Injury] = []
+        self.shootout_score: Optional[tuple[int, int]] = None
+
+    @property
+    def winner(self) -> Team:
+        return self.team1 if self.score1 > self.score2 else self.team2
+
+    @property
+    def loser(self) -> Team:
+        return self.team2 if self.score1 > self.score2 else self.team1
+
+    def __repr__(self):
+        return (f"{self.team1} {self.score1} - {self.team2} {self.score2} "
+                f"({self.decision})")
+
+class GameReporter:
+    """
+    Base reporter: every hook is a no-op. Subclasses override only the events they
+    care about. The simulator never calls a reporter when none is given, so a
+    headless run does no formatting at all.
+
+    Attaching a reporter does not change a seeded game unless narrates_shootout is
+    True: only then are shootouts played attempt by attempt (shootout_round and
+    shootout_attempt), which draws from the random stream differently. Otherwise the
+    shootout is sampled as in a headless game and reported once via shootout_end.
+    """
+    narrates_shootout = False
+    def game_start(self, team1: Team, team2: Team) -> None:
+        pass
+
+    def period_start(self, period: int) -> None:
+        pass
+
+    def period_end(self, period: int, result: GameResult) -> None:
+        pass
+
+    def line_change(self, team: Team, period: int) -> None:
+        pass
+
+    def goalie_swap(self, team: Team, goalie: Player, period: int) -> None:
+        pass
+
+    def injury(self, team: Team, player: Player, period: int) -> None:
+        pass
+
+    def injury_return(self, team: Team, player: Player) -> None:
+        pass
+
+    def shot(self, team: Team, player: Player, period: int) -> None:
+        pass
+
+    def goal(self, team: Team, player: Player, period: int) -> None:
+        pass
+
+    def shootout_round(self, round_num: int) -> None:
+        pass
+
+    def shootout_attempt(self, team: Team, player: Player, scored: bool) -> None:
+        pass
+
+    def shootout_end(self, team1: Team, team2: Team, score1: int, score2: int) -> None:
+        pass
+
+    def game_end(self, result: GameResult) -> None:
+        pass
+
+class ConsoleReporter(GameReporter):
+    """Prints the classic play-by-play, honouring the simulator's print toggles."""
+    narrates_shootout = True
+
+    def __init__(self, print_goals: bool = True, print_injuries: bool = True,
+                 print_line_changes: bool = False):
+        self.print_goals = print_goals
+        self.print_injuries = print_injuries
+        self.print_line_changes = print_line_changes
+
+    def game_start(self, team1: Team, team2: Team) -> None:
+        print(f"\n=== Starting Game: {team1} vs {team2} ===")
+        # Print team parameters (offensive averages, best goalie, injuries)
+        for team in (team1, team2):
+            print(f"{team} - Offensive Avg: {team.current_line.get_average_offensive_value():.1f}, "
+                  f"Best Goalie Def: {team.active_goaltender.defensive_value}, Injuries: {team.injuries}")
+
+    def period_start(self, period: int) -> None:
+        if period <= 3:
+            print(f"\n-- Period {period} --")
+        elif period == 4:
+            print("\n-- Overtime --")
+        else:
+            print("\n-- Shootout --")
+
+    def period_end(self, period: int, result: GameResult) -> None:
+        if period <= 3:
+            print(f"Score after Period {period}: {result.team1} {result.score1} - "
+                  f"{result.team2} {result.score2}")
+
+    def line_change(self, team: Team, period: int) -> None:
+        if self.print_line_changes:
+            print(f"{team}: Line change due to low energy.")
+
+    def injury(self, team: Team, player: Player, period: int) -> None:
+        if self.print_injuries:
+            print(f"{team}: A player got injured!")
+
+    def injury_return(self, team: Team, player: Player) -> None:
+        if self.print_injuries:
+            print(f"{team}: #{player.jersey_number} returns from injury.")
+
+    def goal(self, team: Team, player: Player, period: int) -> None:
+        if self.print_goals:
+            print(f"GOAL! {team} scores via player #{player.jersey_number}!")
+
+    def shootout_round(self, round_num: int) -> None:
+        print(f"\nShootout Round {round_num}")
+
+    def shootout_attempt(self, team: Team, player: Player, scored: bool) -> None:
+        if self.print_goals:
+            if scored:
+                print(f"Shootout: {team} scores via player #{player.jersey_number}!")
+            else:
+                print(f"Shootout: {team} miss (player #{player.jersey_number}).")
+
+    def game_end(self, result: GameResult) -> None:
+        print(f"\n=== Final Score: {result.team1} {result.score1} - {result.team2} {result.score2} ===")
+        print(f"Game decided in {result.decision}.")
+
+# -----------------------------
+# Event Streaming
+# -----------------------------
+
+class Event(NamedTuple):
+    # One row of the event log. Plain values only (team names, jersey numbers) so events
+    # can be written anywhere without holding on to Team or Player objects.
+    game: int
+    kind: str                     # goal, shot, injury, return, line_change, goalie_swap, period_end,
+                                  # shootout, final
+    period: int                   # 1-3 regulation, 4 overtime, 5 shootout (0 before the game)
+    team: str
+    jersey: Optional[int] = None
+    score1: Optional[int] = None  # running score, on period_end and final events
+    score2: Optional[int] = None
+    detail: str = ""
+
+class EventRecorder(GameReporter):
+    """
+    Reporter that turns engine callbacks into Event tuples for the current game.
+    drain() hands over the buffered events and empties the buffer, so memory use is
+    bounded by one game no matter how many games are streamed.
+    """
+    def __init__(self, first_game: int = 1):
+        self.game = first_game - 1
+        self.events: List[Event] = []
+        # Team names are formatted once per game rather than once per event.
+        self._names: Dict[int, str] = {}
+        self._shootout_period = 5
+
+    def drain(self) -> List[Event]:
+        events, self.events = self.events, []
+        return events
+
+    def game_start(self, team1: Team, team2: Team) -> None:
+        self.game += 1
+        self._names = {id(team1): str(team1), id(team2): str(team2)}
+
+    def period_end(self, period: int, result: GameResult) -> None:
+        self.events.append(Event(self.game, "period_end", period, "", None, result.score1, result.score2))
+
+    def line_change(self, team: Team, period: int) -> None:
+        self.events.append(Event(self.game, "line_change", period, self._names[id(team)]))
+
+    def goalie_swap(self, team: Team, goalie: Player, period: int) -> None:
+        self.events.append(Event(self.game, "goalie_swap", period, self._names[id(team)], goalie.jersey_number))
+
+    def injury(self, team: Team, player: Player, period: int) -> None:
+        self.events.append(Event(self.game, "injury", period, self._names[id(team)], player.jersey_number,
+                                 detail=str(player.injury_length)))
+
+    def injury_return(self, team: Team, player: Player) -> None:
+        self.events.append(Event(self.game, "return", 0, self._names[id(team)], player.jersey_number))
+
+    def shot(self, team: Team, player: Player, period: int) -> None:
+        self.events.append(Event(self.game, "shot", period, self._names[id(team)], player.jersey_number))
+
+    def goal(self, team: Team, player: Player, period: int) -> None:
+        self.events.append(Event(self.game, "goal", period, self._names[id(team)], player.jersey_number))
+
+    def shootout_attempt(self, team: Team, player: Player, scored: bool) -> None:
+        self.events.append(Event(self.game, "goal" if scored else "shot", self._shootout_period,
+                                 self._names[id(team)], player.jersey_number, detail="shootout"))
+
+    def shootout_end(self, team1: Team, team2: Team, score1: int, score2: int) -> None:
+        # Shootout goals only, on the shootout winner's row.
+        winner = team1 if score1 > score2 else team2
+        self.events.append(Event(self.game, "shootout", self._shootout_period, self._names[id(winner)],
+                                 None, score1, score2))
+
+    def game_end(self, result: GameResult) -> None:
+        # The final event carries the period the game ended in: 3, 4 (OT) or 5 (shootout).
+        period = 3 + DECISIONS.index(result.decision)
+        self.events.append(Event(self.game, "final", period, str(result.winner), None,
+                                 result.score1, result.score2, result.decision))
+
+class EventSink(ABC):
+    """
+    Buffered event writer. Events are collected in a list and written to the file in
+    bulk every `buffer_size` events; paths ending in .gz are gzip-compressed. Use as a
+    context manager (or call close()) so the last partial buffer is flushed.
+    """
+    def __init__(self, path: str, buffer_size: int = 8192):
+        self.path = path
+        self.buffer_size = buffer_size
+        if path.endswith(".gz"):
+            self._handle = gzip.open(path, "wt", encoding="utf-8", newline="")
+        else:
+            self._handle = open(path, "w", encoding="utf-8", newline="", buffering=1 << 20)
+        self._buffer: List[Event] = []
+        self.count = 0
+        self._write_header()
+
+    def _write_header(self) -> None:
+        pass
+
+    @abstractmethod
+    def _write_batch(self, events: List[Event]) -> None:
+        """Write one buffered batch of events to self._handle."""
+
+    def write(self, event: Event) -> None:
+        self._buffer.append(event)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_all(self, events) -> int:
+        # Consumes any iterable (typically HockeyGameSimulator.iter_game_events) lazily.
+        for event in events:
+            self.write(event)
+        return self.count
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self.count += len(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class JsonlEventSink(EventSink):
+    """One JSON object per line."""
+    def _write_batch(self, events: List[Event]) -> None:
+        dumps = json.JSONEncoder(separators=(",", ":")).encode
+        self._handle.write("".join(dumps(event._asdict()) + "\n" for event in events))
+
+class CsvEventSink(EventSink):
+    """CSV with a header row; empty cells for missing values."""
+    def _write_header(self) -> None:
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(Event._fields)
+
+    def _write_batch(self, events: List[Event]) -> None:
+        self._writer.writerows(events)
+
+def open_event_sink(path: str, buffer_size: int = 8192) -> EventSink:
+    """Pick the sink from the file name: .jsonl or .csv, optionally followed by .gz."""
+    base = path[:-3] if path.endswith(".gz") else path
+    if base.endswith(".jsonl") or base.endswith(".json"):
+        return JsonlEventSink(path, buffer_size)
+    if base.endswith(".csv"):
+        return CsvEventSink(path, buffer_size)
+    raise ValueError(f"Unknown event log format for {path!r}; use .jsonl, .csv, .jsonl.gz or .csv.gz")
+
+# -----------------------------
+# Binary Result Store
+# -----------------------------
+
+# Fixed-width little-endian records. Each game is one row in games.bin and each goal one
+# row in goals.bin, so file offsets are computable and the files can be memory-mapped
+# as record arrays with every field available as a zero-copy column view.
+#   games.bin: team1, team2, score1, score2 (uint16), decision, injuries1, injuries2 (uint8), pad
+#   goals.bin: game (uint32), team (uint16), jersey, period (uint8)
+GAME_RECORD = struct.Struct("<HHHHBBBx")
+GOAL_RECORD = struct.Struct("<IHBB")
+STORE_FORMAT_VERSION = 1
+
+class ResultStoreWriter:
+    """
+    Appends GameResults to a result store directory (games.bin, goals.bin, meta.json).
+    Records are packed with struct into in-memory buffers and written in bulk. Use as a
+    context manager so the last buffer is flushed and the metadata is written.
+    """
+    def __init__(self, directory: str, teams: List[Team], flush_every: int = 4096):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.team_names = [str(team) for team in teams]
+        # Team ids in the store are league positions; looked up by object identity.
+        self._team_ids = {id(team): index for index, team in enumerate(teams)}
+        self.flush_every = flush_every
+        self._games = open(os.path.join(directory, "games.bin"), "wb")
+        self._goals = open(os.path.join(directory, "goals.bin"), "wb")
+        self._game_buffer = bytearray()
+        self._goal_buffer = bytearray()
+        self._pending = 0
+        self.games_written = 0
+
+    def add(self, result: GameResult) -> None:
+        team_ids = self._team_ids
+        team1, team2 = team_ids[id(result.team1)], team_ids[id(result.team2)]
+        injuries1 = sum(1 for injury in result.injuries if injury.team is result.team1)
+        self._game_buffer += GAME_RECORD.pack(team1, team2, result.score1, result.score2,
+                                              DECISIONS.index(result.decision),
+                                              injuries1, len(result.injuries) - injuries1)
+        game = self.games_written
+        for goal in result.goals:
+            self._goal_buffer += GOAL_RECORD.pack(game, team_ids[id(goal.team)],
+                                                  goal.player.jersey_number, goal.period)
+        self.games_written += 1
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        self._games.write(self._game_buffer)
+        self._goals.write(self._goal_buffer)
+        self._game_buffer = bytearray()
+        self._goal_buffer = bytearray()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._games.close()
+        self._goals.close()
+        meta = {"format": STORE_FORMAT_VERSION, "teams": self.team_names,
+                "decisions": list(DECISIONS), "games": self.games_written}
+        with open(os.path.join(self.directory, "meta.json"), "w", encoding="utf-8") as handle:
+            json.dump(meta, handle, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class ResultStoreReader:
+    """
+    Memory-maps a result store and answers aggregate queries with NumPy. `games` and
+    `goals` are read-only record arrays backed directly by the files; queries work on
+    their column views, so no per-game Python objects are created. Requires NumPy.
+    """
+    def __init__(self, directory: str):
+        _require_numpy("Reading a result store")
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as handle:
+            meta = json.load(handle)
+        if meta.get("format") != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported result store format: {meta.get('format')!r}")
+        self.team_names: List[str] = meta["teams"]
+        game_dtype = np.dtype([("team1", "<u2"), ("team2", "<u2"), ("score1", "<u2"), ("score2", "<u2"),
+                               ("decision", "u1"), ("injuries1", "u1"), ("injuries2", "u1"), ("pad", "u1")])
+        goal_dtype = np.dtype([("game", "<u4"), ("team", "<u2"), ("jersey", "u1"), ("period", "u1")])
+        self.games = self._map(os.path.join(directory, "games.bin"), game_dtype)
+        self.goals = self._map(os.path.join(directory, "goals.bin"), goal_dtype)
+
+    @staticmethod
+    def _map(path: str, dtype):
+        # np.memmap cannot map an empty file, so an empty store gets an empty array.
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r")
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def team_totals(self) -> Dict[str, "np.ndarray"]:
+        """Per-team counters (indexed by team id), matching the fields of show_team_stats."""
+        games, size = self.games, len(self.team_names)
+        team1, team2 = games["team1"], games["team2"]
+        score1, score2 = games["score1"].astype(np.int64), games["score2"].astype(np.int64)
+        team1_won = score1 > score2
+        winner = np.where(team1_won, team1, team2)
+        loser = np.where(team1_won, team2, team1)
+        decision = games["decision"]
+
+        def count(ids, mask=None):
+            return np.bincount(ids if mask is None else ids[mask], minlength=size)
+
+        def add(values1, values2):
+            # Weighted bincount sums in float64 (exact for these counts); cast back so
+            # every total is an integer like the other counters.
+            return (np.bincount(team1, values1, size) + np.bincount(team2, values2, size)).astype(np.int64)
+
+        totals = {
+            "games_played": count(team1) + count(team2),
+            "goals_for": add(score1, score2),
+            "goals_against": add(score2, score1),
+            "injuries": add(games["injuries1"], games["injuries2"]),
+        }
+        for code, name in enumerate(DECISIONS):
+            totals[f"{name}_wins"] = count(winner, decision == code)
+            totals[f"{name}_losses"] = count(loser, decision == code)
+        totals["points"] = (2 * (totals["regular_wins"] + totals["overtime_wins"] + totals["shootout_wins"]) +
+                            totals["overtime_losses"] + totals["shootout_losses"])
+        return totals
+
+    def standings(self) -> List[tuple]:
+        """(team, games played, points, goals for, goals against) sorted by points, then goal differential."""
+        totals = self.team_totals()
+        order = np.lexsort((-(totals["goals_for"] - totals["goals_against"]), -totals["points"]))
+        return [(self.team_names[i], int(totals["games_played"][i]), int(totals["points"][i]),
+                 int(totals["goals_for"][i]), int(totals["goals_against"][i])) for i in order]
+
+    def goal_leaders(self, count: int = 10) -> List[tuple[str, int, int]]:
+        """Top scorers as (team, jersey, goals). Jerseys identify roster spots, as in ReplicaSummary."""
+        keys = self.goals["team"].astype(np.int64) * 256 + self.goals["jersey"]
+        totals = np.bincount(keys)
+        top = np.argsort(-totals, kind="stable")[:count]
+        return [(self.team_names[key // 256], int(key % 256), int(totals[key])) for key in top if totals[key]]
+
+    def decision_rates(self) -> Dict[str, float]:
+        counts = np.bincount(self.games["decision"], minlength=len(DECISIONS))
+        total = max(1, len(self.games))
+        return {name: float(counts[code]) / total for code, name in enumerate(DECISIONS)}
+
+    def show(self, leaders: int = 10) -> None:
+        print(f"\n=== Result Store: {len(self.games)} games, {len(self.goals)} goals ===")
+        print(f"{'Team':<28}{'GP':>7}{'PTS':>7}{'GF':>7}{'GA':>7}")
+        for name, played, points, goals_for, goals_against in self.standings():
+            print(f"{name:<28}{played:>7}{points:>7}{goals_for:>7}{goals_against:>7}")
+        print("\nGoal leaders:")
+        for name, jersey, goals in self.goal_leaders(leaders):
+            print(f"{name} #{jersey}: {goals}")
+        rates = self.decision_rates()
+        print(f"\nOvertime rate: {rates['overtime']:.1%}, shootout rate: {rates['shootout']:.1%}")
+
+# -----------------------------
+# Instrumentation
+# -----------------------------
+
+class SimulationStats:
+    """
+    Opt-in counters and per-phase timers for the game engine. Attach one with
+    HockeyGameSimulator.enable_stats(); while no stats object is attached the engine runs
+    its uninstrumented path and pays a single None check per period.
+    """
+    # Phases of a team iteration (plus the energy update after each iteration), in the
+    # order they run. Timers are cumulative seconds per phase.
+    PHASES = ("goalie", "line_change", "injury", "shot", "energy")
+    COUNTERS = ("periods", "iterations", "shots", "goals", "line_changes", "goalie_swaps",
+                "injuries", "emergency_goalies")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        # Dictionaries keyed by the names above keep the report code generic.
+        self.counters: Dict[str, int] = {name: 0 for name in self.COUNTERS}
+        self.timers: Dict[str, float] = {name: 0.0 for name in self.PHASES}
+
+    def report(self) -> str:
+        total = sum(self.timers.values())
+        lines = ["=== Simulation Stats ==="]
+        lines += [f"{name.replace('_', ' ').title():<18}{value:>12,}" for name, value in self.counters.items()]
+        lines.append(f"\n{'Phase':<18}{'Time (ms)':>12}{'Share':>8}")
+        for name, seconds in self.timers.items():
+            share = seconds / total if total else 0.0
+            lines.append(f"{name.replace('_', ' ').title():<18}{seconds * 1000:>12.1f}{share:>8.1%}")
+        return "\n".join(lines)
+
+# -----------------------------
+# League Index
+# -----------------------------
+
+class LeagueIndex:
+    """
+    Standings and league-wide scoring leaders kept up to date game by game, so reading
+    them during a season never rescans the league. The simulator calls record_game after
+    each game's stats are added and record_goal whenever a player scores.
+    """
+    # Stale heap entries are dropped in one pass once they outnumber the live ones by
+    # this much, which keeps the heap small at O(1) amortized cost per goal.
+    COMPACT_SLACK = 1024
+
+    def __init__(self, teams: Sequence[Team] = ()):
+        self.rebuild(teams)
+
+    @staticmethod
+    def _standing_key(team: Team, position: int) -> tuple:
+        # Ascending order of this key is the standings order: points, wins, goal
+        # differential (all descending), then league position, as a stable sort gives.
+        return (-team.points, -team.wins, -team.goal_differential, position)
+
+    def rebuild(self, teams: Sequence[Team]) -> None:
+        """Index `teams` from scratch (new league, loaded snapshot, reset statistics)."""
+        self.teams = list(teams)
+        # League position by team id; teams outside the league (e.g. a copied pair in a
+        # benchmark) are simply not tracked.
+        self._positions: Dict[int, int] = {id(team): position for position, team in enumerate(self.teams)}
+        # Max-heap of scorers as (-goals, sequence, player, team). A player is pushed again
+        # at every goal instead of being updated in place; entries whose goal count no
+        # longer matches the player are stale and skipped. The sequence number breaks ties
+        # in favour of whoever reached the total first and keeps players from being compared.
+        self._scorers: List[tuple] = []
+        self._sequence = itertools.count()
+        self._live_scorers = 0
+        played = any(team.games_played for team in self.teams)
+        # Each team's current key, needed to find its entry when its record changes. A
+        # league that has not played (every new league) has all-zero records, so its keys
+        # are already in order and there are no scorers to find.
+        if played:
+            self._keys = [self._standing_key(team, position) for position, team in enumerate(self.teams)]
+        else:
+            self._keys = [(0, 0, 0, position) for position in range(len(self.teams))]
+        # A sorted list searched with bisect: finding a team's entry is O(log n) and moving
+        # it is a memmove over 32 entries, so reading the standings is a plain copy.
+        self._standings = sorted(self._keys) if played else list(self._keys)
+        if not played:
+            return
+        scorers = [(player, team) for team in self.teams if team.materialized
+                   for player in team.players + team.goaltenders + team.injured_reserve
+                   if player.goals_scored]
+        scorers.sort(key=lambda entry: -entry[0].goals_scored)
+        for player, team in scorers:
+            self.record_goal(team, player, player.goals_scored)
+
+    def record_game(self, team1: Team, team2: Team) -> None:
+        """Move both teams to their new places after their game's stats were added."""
+        for team in (team1, team2):
+            position = self._positions.get(id(team))
+            if position is None:
+                continue
+            standings = self._standings
+            del standings[bisect.bisect_left(standings, self._keys[position])]
+            key = self._keys[position] = self._standing_key(team, position)
+            bisect.insort(standings, key)
+
+    def record_goal(self, team: Team, player: Player, added: int = 1) -> None:
+        """Register the player's new goal total after goals_scored was increased by `added`."""
+        if player.goals_scored == added:
+            self._live_scorers += 1
+        heapq.heappush(self._scorers, (-player.goals_scored, next(self._sequence), player, team))
+        if len(self._scorers) > 2 * self._live_scorers + self.COMPACT_SLACK:
+            self._scorers = [entry for entry in self._scorers if -entry[0] == entry[2].goals_scored]
+            heapq.heapify(self._scorers)
+            self._live_scorers = len(self._scorers)
+
+    def standings(self) -> List[Team]:
+        teams = self.teams
+        return [teams[key[-1]] for key in self._standings]
+
+    def leaders(self, count: int = 10) -> List[tuple[Team, Player, int]]:
+        """Top `count` scorers as (team, player, goals), most goals first."""
+        # Pop until `count` current entries are found (stale ones are discarded for
+        # good), then push the current ones back: O((count + stale) log n).
+        scorers, top = self._scorers, []
+        while scorers and len(top) < count:
+            entry = heapq.heappop(scorers)
+            if -entry[0] == entry[2].goals_scored:
+                top.append(entry)
+        for entry in top:
+            heapq.heappush(scorers, entry)
+        return [(team, player, player.goals_scored) for _, _, player, team in top]
+
 # -----------------------------
 # HockeyGameSimulator Class
 # -----------------------------
 
 class HockeyGameSimulator:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, rng: Optional[RandomSource] = None,
+                 config: Optional[SimulationConfig] = None):
+        # Each simulator owns its random generator (shared with the teams it creates),
+        # so two simulators in one process never disturb each other and a seed
+        # reproduces the league and every game exactly.
+        self.rng: RandomSource = rng if rng is not None else random.Random(seed)
+        # Model constants, shared with the teams like the generator. Fixed for the
+        # simulator's lifetime; create another simulator to play by other values.
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.config.validate()
         # Using a list for teams because the order of teams is not critical,
         # and lists allow easy random sampling and iteration.
         self.teams: List[Team] = []
@@ -258,6 +1266,12 @@ class HockeyGameSimulator:
         self.print_injuries = True
         self.print_line_changes = False
         self.default_games_to_simulate = 1
+        # Instrumentation is off unless enable_stats() attaches a SimulationStats.
+        self.stats: Optional[SimulationStats] = None
+        # Odds for single matchups, reused until one of the two teams changes.
+        self.matchup_cache = MatchupCache()
+        # Standings and scoring leaders, updated as games are played.
+        self.league_index = LeagueIndex()
 
     def create_league(self) -> None:
         # List of 32 unique cities and team names (format: City TeamName)
@@ -277,145 +1291,628 @@ class HockeyGameSimulator:
                  "Islanders"]
         
         # Shuffle lists to randomize pairings
-        random.shuffle(cities)
-        random.shuffle(names)
+        self.rng.shuffle(cities)
+        self.rng.shuffle(names)
         
-        for city, name in zip(cities, names):
-            team = Team(city, name)
-            team.generate_team()
-            self.teams.append(team)
+        # Rosters are generated lazily, on first use, each from a seed derived from one league
+        # draw and the team's position (string seeds, as in replica_seed). A run that only
+        # needs a few teams never builds the rest, and neither rosters nor the simulator's
+        # own stream depend on the order in which teams are first touched.
+        league_seed = self.rng.randint(0, 2**63 - 1)
+        for index, (city, name) in enumerate(zip(cities, names)):
+            self.teams.append(Team(city, name, self.rng, roster_seed=f"{league_seed}:{index}",
+                                   config=self.config))
+        self.league_index.rebuild(self.teams)
 
-    def simulate_game(self, team1: Team, team2: Team) -> None:
-        print(f"\n=== Starting Game: {team1} vs {team2} ===")
+    # -----------------------------
+    # League Snapshots
+    # -----------------------------
+
+    SNAPSHOT_FORMAT = 4
+
+    def save(self, path: str) -> None:
+        """
+        Snapshot the whole league (teams, rosters, lines, active goalies, injuries,
+        energies, stats) plus the random generator state and model config with pickle
+        protocol 5, so a loaded simulator continues exactly where this one stopped.
+        """
+        snapshot = {
+            "format": self.SNAPSHOT_FORMAT,
+            "rng": self.rng,
+            "config": self.config,
+            "teams": self.teams,
+            "settings": (self.print_goals, self.print_injuries, self.print_line_changes,
+                         self.default_games_to_simulate),
+        }
+        with open(path, "wb") as handle:
+            pickle.dump(snapshot, handle, protocol=5)
+
+    @classmethod
+    def load(cls, path: str, seed: Optional[int] = None) -> "HockeyGameSimulator":
+        """
+        Restore a simulator written by save(). Pass a seed to fork the snapshot onto a new
+        random stream (e.g. many simulations from one mid-season checkpoint); without it
+        the saved generator state is resumed. Only load files you trust: snapshots are pickles.
+        """
+        with open(path, "rb") as handle:
+            snapshot = pickle.load(handle)
+        if not isinstance(snapshot, dict) or snapshot.get("format") != cls.SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a league snapshot this version can read.")
+        simulator = cls(rng=snapshot["rng"] if seed is None else random.Random(seed),
+                        config=snapshot["config"])
+        (simulator.print_goals, simulator.print_injuries, simulator.print_line_changes,
+         simulator.default_games_to_simulate) = snapshot["settings"]
+        simulator.adopt_teams(snapshot["teams"])
+        return simulator
+
+    def adopt_teams(self, teams: List[Team]) -> None:
+        """
+        Use the given teams as the league; they draw from this simulator's RNG and play
+        by its config from now on.
+        """
+        for team in teams:
+            team.rng = self.rng
+            team.config = self.config
+        self.teams = teams
+        self.league_index.rebuild(teams)
+
+    def simulate_game(self, team1: Team, team2: Team,
+                      reporter: Optional[GameReporter] = None) -> GameResult:
+        """
+        Simulate one game and return its GameResult. Nothing is printed unless a
+        reporter is supplied (the interactive menu passes a ConsoleReporter).
+        """
+        returned1 = team1.maintain_roster()
+        returned2 = team2.maintain_roster()
+        result = GameResult(team1, team2)
         # Reset current lines to the first line for each team
         team1.current_line = team1.lines[0]
         team2.current_line = team2.lines[0]
         # Ensure starting goaltenders are set
         team1._initial_update_active_goaltender()
         team2._initial_update_active_goaltender()
-        
-        # Print team parameters (offensive averages, best goalie, injuries)
-        print(f"{team1} - Offensive Avg: {team1.current_line.get_average_offensive_value():.1f}, "
-              f"Best Goalie Def: {team1.active_goaltender.defensive_value}, Injuries: {team1.injuries}")
-        print(f"{team2} - Offensive Avg: {team2.current_line.get_average_offensive_value():.1f}, "
-              f"Best Goalie Def: {team2.active_goaltender.defensive_value}, Injuries: {team2.injuries}")
-        
-        team1_score = team2_score = 0
-        game_decision = "regular"
+        if reporter is not None:
+            reporter.game_start(team1, team2)
+            for team, returned in ((team1, returned1), (team2, returned2)):
+                for player in returned:
+                    reporter.injury_return(team, player)
 
         # Simulate three regular periods
         for period in range(1, 4):
-            print(f"\n-- Period {period} --")
-            period_scores = self.simulate_period(team1, team2, period)
-            team1_score += period_scores[0]
-            team2_score += period_scores[1]
-            print(f"Score after Period {period}: {team1} {team1_score} - {team2} {team2_score}")
+            if reporter is not None:
+                reporter.period_start(period)
+            period_scores = self.simulate_period(team1, team2, period, result=result, reporter=reporter)
+            result.score1 += period_scores[0]
+            result.score2 += period_scores[1]
+            if reporter is not None:
+                reporter.period_end(period, result)
 
         # Overtime if needed
-        if team1_score == team2_score:
-            print("\n-- Overtime --")
-            ot_scores = self.simulate_period(team1, team2, period=4, overtime=True)
-            team1_score += ot_scores[0]
-            team2_score += ot_scores[1]
-            if team1_score == team2_score:
-                print("\n-- Shootout --")
-                so_scores = self.simulate_shootout(team1, team2)
-                team1_score += so_scores[0]
-                team2_score += so_scores[1]
-                game_decision = "shootout"
+        if result.score1 == result.score2:
+            if reporter is not None:
+                reporter.period_start(4)
+            ot_scores = self.simulate_period(team1, team2, period=4, overtime=True,
+                                             result=result, reporter=reporter)
+            result.score1 += ot_scores[0]
+            result.score2 += ot_scores[1]
+            if reporter is not None:
+                reporter.period_end(4, result)
+            if result.score1 == result.score2:
+                if reporter is not None:
+                    reporter.period_start(5)
+                so_scores = self.simulate_shootout(team1, team2, reporter=reporter)
+                result.shootout_score = so_scores
+                result.score1 += so_scores[0]
+                result.score2 += so_scores[1]
+                result.decision = "shootout"
             else:
-                game_decision = "overtime"
+                result.decision = "overtime"
 
         # Update team statistics based on game decision
-        self._update_game_stats(team1, team2, team1_score, team2_score, game_decision)
-        print(f"\n=== Final Score: {team1} {team1_score} - {team2} {team2_score} ===")
-        print(f"Game decided in {game_decision}.")
+        self._update_game_stats(team1, team2, result.score1, result.score2, result.decision)
+        if reporter is not None:
+            reporter.game_end(result)
+        return result
 
-    def simulate_period(self, team1: Team, team2: Team, period: int, overtime: bool = False) -> tuple[int, int]:
+    def simulate_period(self, team1: Team, team2: Team, period: int, overtime: bool = False,
+                        result: Optional[GameResult] = None,
+                        reporter: Optional[GameReporter] = None) -> tuple[int, int]:
+        if self.stats is None:
+            iterate, update_energy = self._simulate_team_iteration, self._update_energy
+        else:
+            # Same loop with every step timed; the steps themselves are shared.
+            self.stats.counters["periods"] += 1
+            iterate, update_energy = self._simulate_team_iteration_instrumented, self._update_energy_instrumented
         score1 = score2 = 0
-        for iteration in range(10):
+        for iteration in range(self.config.iterations_per_period):
             # Each iteration: team1 attacks then team2 attacks.
-            if self._simulate_team_iteration(team1, team2, period):
+            if iterate(team1, team2, period, result, reporter):
                 score1 += 1
-            if self._simulate_team_iteration(team2, team1, period):
+            if iterate(team2, team1, period, result, reporter):
                 score2 += 1
             # Update energy for all players in both teams
-            team1.update_line_energy()
-            team2.update_line_energy()
+            update_energy(team1, team2)
         # Returning a tuple because the score pair is a fixed-size, immutable set of values.
         return score1, score2
 
-    def _simulate_team_iteration(self, attacking_team: Team, defending_team: Team, period: int) -> bool:
+    def _simulate_team_iteration(self, attacking_team: Team, defending_team: Team, period: int,
+                                 result: Optional[GameResult] = None,
+                                 reporter: Optional[GameReporter] = None) -> bool:
+        # The model's rules live in the step methods below, which the instrumented
+        # iteration calls too, so enabling stats never changes a seeded result.
+        self._goalie_step(defending_team, period, reporter)
+        self._line_change_step(attacking_team, period, reporter)
+        self._injury_step(attacking_team, period, result, reporter)
+        return self._shot_step(attacking_team, defending_team, period, result, reporter)[1]
+
+    # -----------------------------
+    # Team Iteration Steps
+    # -----------------------------
+
+    @staticmethod
+    def _goalie_step(defending_team: Team, period: int, reporter: Optional[GameReporter]) -> None:
         # First update defending team's active goalie (if injured or low energy)
-        defending_team.update_active_goaltender()
+        if reporter is None:
+            defending_team.update_active_goaltender()
+        else:
+            goalie = defending_team.active_goaltender
+            defending_team.update_active_goaltender()
+            if defending_team.active_goaltender is not goalie:
+                reporter.goalie_swap(defending_team, defending_team.active_goaltender, period)
 
+    def _line_change_step(self, attacking_team: Team, period: int, reporter: Optional[GameReporter]) -> None:
         # Check if current line energy is low; if so, change to best available line.
-        if attacking_team.current_line.get_average_energy() < 18:
-            if self.print_line_changes:
-                print(f"{attacking_team}: Line change due to low energy.")
+        if attacking_team.current_line.get_average_energy() < self.config.line_change_energy:
+            if reporter is not None:
+                reporter.line_change(attacking_team, period)
             attacking_team.select_best_line()
 
+    @staticmethod
+    def _injury_step(attacking_team: Team, period: int, result: Optional[GameResult],
+                     reporter: Optional[GameReporter]) -> Optional[Player]:
         # Simulate injury (no injuries during shootout, so this is for regular/overtime)
-        if attacking_team.handle_injury(period) and self.print_injuries:
-            print(f"{attacking_team}: A player got injured!")
+        injured_player = attacking_team.handle_injury(period)
+        if injured_player is not None:
+            if result is not None:
+                result.injuries.append(Injury(period, attacking_team, injured_player))
+            if reporter is not None:
+                reporter.injury(attacking_team, injured_player, period)
+        return injured_player
 
-        # Calculate shot probability:
+    @staticmethod
+    def _shot_probability(line: Line, defending_line: Line) -> float:
         # shot_prob = (((Avg Energy) + (Line Offense Avg - Opponent Line Defense Avg)) / 100) * 5
-        shot_prob = ((attacking_team.current_line.get_average_energy() +
-                     (attacking_team.current_line.get_average_offensive_value() -
-                      defending_team.current_line.get_average_defensive_value())) / 100) * 5
-
-        if random.random() <= shot_prob:
-            # Select shooter from top 3 offensive players in current line
-            shooter = random.choice(attacking_team.current_line.get_top_offensive_players())
-            # Calculate goal probability:
-            # goal_prob = ((shooter.energy) + (shooter.offensive_value * 0.75 - Opponent Goalie Def)) / 100
-            goal_prob = ((shooter.energy + (shooter.offensive_value * 0.75 -
-                         defending_team.active_goaltender.defensive_value)) / 100)
-            if random.random() <= goal_prob:
-                shooter.goals_scored += 1
-                if self.print_goals:
-                    print(f"GOAL! {attacking_team} scores via player #{shooter.jersey_number}!")
-                return True
-        return False
-
-    def simulate_shootout(self, team1: Team, team2: Team) -> tuple[int, int]:
+        return ((line.get_average_energy() +
+                 (line.get_average_offensive_value() - defending_line.get_average_defensive_value())) / 100) * 5
+
+    def _goal_probability(self, shooter: Player, goalie: Player) -> float:
+        # goal_prob = ((shooter.energy) + (shooter.offensive_value * 0.75 - Opponent Goalie Def)) / 100
+        return ((shooter.energy + (shooter.offensive_value * self.config.shooter_offense_factor -
+                 goalie.defensive_value)) / 100)
+
+    def _shot_step(self, attacking_team: Team, defending_team: Team, period: int,
+                   result: Optional[GameResult], reporter: Optional[GameReporter]) -> tuple[bool, bool]:
+        """Maybe take a shot and maybe score; returns (shot taken, goal scored)."""
+        line = attacking_team.current_line
+        rng = self.rng
+        if rng.random() > self._shot_probability(line, defending_team.current_line):
+            return False, False
+        # Select shooter from top 3 offensive players in current line
+        shooter = rng.choice(line.get_top_offensive_players())
+        if reporter is not None:
+            reporter.shot(attacking_team, shooter, period)
+        if rng.random() > self._goal_probability(shooter, defending_team.active_goaltender):
+            return True, False
+        shooter.goals_scored += 1
+        self.league_index.record_goal(attacking_team, shooter)
+        if result is not None:
+            result.goals.append(Goal(period, attacking_team, shooter))
+        if reporter is not None:
+            reporter.goal(attacking_team, shooter, period)
+        return True, True
+
+    @staticmethod
+    def _update_energy(team1: Team, team2: Team) -> None:
+        team1.update_line_energy()
+        team2.update_line_energy()
+
+    # -----------------------------
+    # Instrumentation
+    # -----------------------------
+
+    def enable_stats(self) -> SimulationStats:
+        """Start collecting engine counters and phase timers; returns the stats object."""
+        if self.stats is None:
+            self.stats = SimulationStats()
+        return self.stats
+
+    def disable_stats(self) -> None:
+        self.stats = None
+
+    def _update_energy_instrumented(self, team1: Team, team2: Team) -> None:
+        start = time.perf_counter()
+        self._update_energy(team1, team2)
+        self.stats.timers["energy"] += time.perf_counter() - start
+
+    def _simulate_team_iteration_instrumented(self, attacking_team: Team, defending_team: Team,
+                                              period: int, result: Optional[GameResult],
+                                              reporter: Optional[GameReporter]) -> bool:
+        # The same steps as _simulate_team_iteration, in the same order; only the counters
+        # and phase timers around them are added here.
+        counters, timers = self.stats.counters, self.stats.timers
+        clock = time.perf_counter
+        counters["iterations"] += 1
+
+        start = clock()
+        goalie, goalie_count = defending_team.active_goaltender, len(defending_team.goaltenders)
+        self._goalie_step(defending_team, period, reporter)
+        counters["goalie_swaps"] += defending_team.active_goaltender is not goalie
+        counters["emergency_goalies"] += len(defending_team.goaltenders) - goalie_count
+        lap = clock()
+        timers["goalie"] += lap - start
+
+        start, line = lap, attacking_team.current_line
+        self._line_change_step(attacking_team, period, reporter)
+        counters["line_changes"] += attacking_team.current_line is not line
+        lap = clock()
+        timers["line_change"] += lap - start
+
+        start = lap
+        counters["injuries"] += self._injury_step(attacking_team, period, result, reporter) is not None
+        lap = clock()
+        timers["injury"] += lap - start
+
+        start = lap
+        shot, scored = self._shot_step(attacking_team, defending_team, period, result, reporter)
+        counters["shots"] += shot
+        counters["goals"] += scored
+        timers["shot"] += clock() - start
+        return scored
+
+    def simulate_shootout(self, team1: Team, team2: Team,
+                          reporter: Optional[GameReporter] = None) -> tuple[int, int]:
+        # The outcome is sampled directly unless the reporter narrates shootouts attempt by
+        # attempt (ConsoleReporter), so recording events never changes a seeded result.
+        if reporter is None or not reporter.narrates_shootout:
+            score1, score2 = self._sample_shootout(team1, team2)
+            if reporter is not None:
+                reporter.shootout_end(team1, team2, score1, score2)
+            return score1, score2
+        rng = self.rng
         score1 = score2 = 0
         round_num = 1
         # Continue for at least 3 rounds; then sudden death rounds until a winner.
         while True:
-            print(f"\nShootout Round {round_num}")
+            reporter.shootout_round(round_num)
             # Team 1 attempt
-            shooter1 = random.choice([p for p in team1.players if p.position == "Skater" and not p.injured])
+            shooter1 = rng.choice([p for p in team1.players if p.position == "Skater" and not p.injured])
             # Use defending goalie of team2 (ensure update)
             team2.update_active_goaltender()
             # According to instructions, subtract shooter offensive from goalie defensive.
-            if (team2.active_goaltender.defensive_value - shooter1.offensive_value) < 0:
+            scored = (team2.active_goaltender.defensive_value - shooter1.offensive_value) < 0
+            if scored:
                 score1 += 1
-                if self.print_goals:
-                    print(f"Shootout: {team1} scores via player #{shooter1.jersey_number}!")
-            else:
-                if self.print_goals:
-                    print(f"Shootout: {team1} miss (player #{shooter1.jersey_number}).")
+            reporter.shootout_attempt(team1, shooter1, scored)
             # Team 2 attempt
-            shooter2 = random.choice([p for p in team2.players if p.position == "Skater" and not p.injured])
+            shooter2 = rng.choice([p for p in team2.players if p.position == "Skater" and not p.injured])
             team1.update_active_goaltender()
-            if (team1.active_goaltender.defensive_value - shooter2.offensive_value) < 0:
+            scored = (team1.active_goaltender.defensive_value - shooter2.offensive_value) < 0
+            if scored:
                 score2 += 1
-                if self.print_goals:
-                    print(f"Shootout: {team2} scores via player #{shooter2.jersey_number}!")
-            else:
-                if self.print_goals:
-                    print(f"Shootout: {team2} miss (player #{shooter2.jersey_number}).")
+            reporter.shootout_attempt(team2, shooter2, scored)
 
             # After at least 3 rounds, if scores are not equal, we have a winner.
             if round_num >= 3 and score1 != score2:
                 break
+            if round_num == 3:
+                # Still tied: if both teams always score or never score, sudden death could
+                # never separate them, so settle it with a coin flip as _sample_shootout does.
+                # The goalies were picked in round one and cannot change during a shootout.
+                p1 = team1.shootout_scoring_probability(team2.active_goaltender.defensive_value)
+                p2 = team2.shootout_scoring_probability(team1.active_goaltender.defensive_value)
+                if p1 * (1 - p2) + p2 * (1 - p1) == 0:
+                    if rng.random() < 0.5:
+                        score1 += 1
+                    else:
+                        score2 += 1
+                    break
             round_num += 1
 
         # Returning a tuple for the final shootout score, as its size and structure are fixed.
         return score1, score2
 
+    def _sample_shootout(self, team1: Team, team2: Team) -> tuple[int, int]:
+        """
+        Draw a shootout result with the same distribution as the round-by-round version.
+        Every attempt is an independent Bernoulli(p) for the shooting team, so the first
+        three rounds are two binomials. If they tie, the number of further tied rounds is
+        geometric with the per-round chance q that exactly one team scores, each tied round
+        is scored by both with chance p1*p2/(1-q), and the deciding round goes to team 1
+        with chance p1*(1-p2)/q.
+        """
+        rand = self.rng.random
+        # Goalies cannot tire or get hurt during a shootout, so one update picks the goalie
+        # for every round, just as the first round of the narrated version does.
+        team2.update_active_goaltender()
+        team1.update_active_goaltender()
+        p1 = team1.shootout_scoring_probability(team2.active_goaltender.defensive_value)
+        p2 = team2.shootout_scoring_probability(team1.active_goaltender.defensive_value)
+
+        score1 = (rand() < p1) + (rand() < p1) + (rand() < p1)
+        score2 = (rand() < p2) + (rand() < p2) + (rand() < p2)
+        if score1 != score2:
+            return score1, score2
+
+        decisive = p1 * (1 - p2) + p2 * (1 - p1)
+        if decisive == 0:
+            # Both teams always score or never score, so rounds could never separate them
+            # (the narrated version would loop forever); settle it with a coin flip.
+            if rand() < 0.5:
+                return score1 + 1, score2
+            return score1, score2 + 1
+
+        tied_rounds = 0
+        if decisive < 1:
+            # Inverse-CDF draw of a geometric count (failures before the first success).
+            tied_rounds = int(math.log(1.0 - rand()) / math.log(1.0 - decisive))
+        if tied_rounds:
+            both_score = p1 * p2 / (1 - decisive)
+            extra = sum(1 for _ in range(tied_rounds) if rand() < both_score)
+            score1 += extra
+            score2 += extra
+        if rand() * decisive < p1 * (1 - p2):
+            return score1 + 1, score2
+        return score1, score2 + 1
+
+    # -----------------------------
+    # Season Methods
+    # -----------------------------
+
+    def build_schedule(self, games_per_team: int = 82) -> List[tuple[Team, Team]]:
+        """
+        Round-robin schedule built with the circle method: one team stays fixed while
+        the others rotate, so every round each team plays exactly once. Rounds cycle
+        through all opponents (swapping home and away every full cycle) until each team
+        has played games_per_team games. With an odd number of teams one team sits out
+        each round, so extra rounds are played among the teams still short; if the
+        league's total of games is odd, one team ends a single game short.
+        """
+        # A None entry acts as the bye slot when the league has an odd number of teams.
+        rotation: List[Optional[Team]] = list(self.teams)
+        if len(rotation) % 2:
+            rotation.append(None)
+        num_slots = len(rotation)
+        rounds_per_cycle = num_slots - 1
+        fixed, rotating = rotation[0], rotation[1:]
+
+        schedule: List[tuple[Team, Team]] = []
+        # Byes leave some teams behind, so rounds continue until at most one team is short.
+        # Two short teams always meet within a cycle, which ends the loop; with an even
+        # team count it ends after exactly games_per_team rounds.
+        played = dict.fromkeys(self.teams, 0)
+        short = len(played) if games_per_team > 0 else 0
+        round_index = 0
+        while short > 1:
+            cycle, offset = divmod(round_index, rounds_per_cycle)
+            # Rotate the non-fixed teams by one slot per round.
+            shift = offset % len(rotating)
+            arrangement = [fixed] + rotating[shift:] + rotating[:shift]
+            for i in range(num_slots // 2):
+                home, away = arrangement[i], arrangement[num_slots - 1 - i]
+                if home is None or away is None:
+                    continue
+                # Teams that already have their games sit out the extra rounds.
+                if played[home] == games_per_team or played[away] == games_per_team:
+                    continue
+                # Alternate venues every round and flip the pattern every full cycle.
+                if (offset % 2) ^ (cycle % 2):
+                    home, away = away, home
+                schedule.append((home, away))
+                for team in (home, away):
+                    played[team] += 1
+                    short -= played[team] == games_per_team
+            round_index += 1
+        return schedule
+
+    def simulate_season(self, schedule: Optional[List[tuple[Team, Team]]] = None,
+                        reporter: Optional[GameReporter] = None) -> List[GameResult]:
+        """
+        Play every game in the schedule (default: an 82-game round-robin) in order and
+        return the results. Team statistics accumulate exactly as for single games.
+        """
+        if schedule is None:
+            schedule = self.build_schedule()
+        simulate_game = self.simulate_game
+        return [simulate_game(team1, team2, reporter) for team1, team2 in schedule]
+
+    def iter_game_events(self, schedule: Optional[List[tuple[Team, Team]]] = None,
+                         first_game: int = 1) -> Iterator[Event]:
+        """
+        Play the schedule (default: an 82-game round-robin) and yield each game's events
+        as soon as the game ends. Only one game's events are held in memory at a time.
+        """
+        if schedule is None:
+            schedule = self.build_schedule()
+        recorder = EventRecorder(first_game)
+        for team1, team2 in schedule:
+            self.simulate_game(team1, team2, recorder)
+            yield from recorder.drain()
+
+    def standings(self) -> List[Team]:
+        # Sorted by points, then wins, then goal differential (all descending); kept in
+        # order by league_index as games are played, so this is only a copy.
+        return self.league_index.standings()
+
+    def leaders(self, count: int = 10) -> List[tuple[Team, Player, int]]:
+        """League-wide top scorers as (team, player, goals), from league_index."""
+        return self.league_index.leaders(count)
+
+    def show_standings(self) -> None:
+        print(f"\n{'Rank':>4}  {'Team':<28}{'GP':>4}{'W':>4}{'L':>4}{'OTL':>5}{'PTS':>5}"
+              f"{'GF':>5}{'GA':>5}{'DIFF':>6}")
+        for rank, team in enumerate(self.standings(), start=1):
+            losses = team.regular_losses
+            ot_losses = team.overtime_losses + team.shootout_losses
+            print(f"{rank:>4}  {str(team):<28}{team.games_played:>4}{team.wins:>4}{losses:>4}"
+                  f"{ot_losses:>5}{team.points:>5}{team.goals_for:>5}{team.goals_against:>5}"
+                  f"{team.goal_differential:>+6}")
+
+    def show_leaders(self, count: int = 10) -> None:
+        print("\nGoal leaders:")
+        for team, player, goals in self.leaders(count):
+            print(f"{team} #{player.jersey_number}: {goals}")
+
+    def load_schedule(self, path: str) -> List[tuple[Team, Team]]:
+        """
+        Read a custom schedule: one game per line as "Team One,Team Two" using the
+        full "City Name" of each team. Blank lines and lines starting with # are skipped.
+        """
+        # A dictionary gives direct lookup from the printed team name to the Team object.
+        by_name = {str(team): team for team in self.teams}
+        schedule: List[tuple[Team, Team]] = []
+        with open(path, encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    name1, name2 = (part.strip() for part in line.split(","))
+                    game = (by_name[name1], by_name[name2])
+                except (ValueError, KeyError):
+                    raise ValueError(f"{path}:{line_number}: invalid game entry {line!r}") from None
+                if name1 == name2:
+                    raise ValueError(f"{path}:{line_number}: a team cannot play itself: {line!r}")
+                schedule.append(game)
+        return schedule
+
+    def run_replicas(self, replicas: int, seed: int = 0, workers: Optional[int] = None,
+                     games_per_team: int = 82) -> "ReplicaSummary":
+        """
+        Simulate `replicas` independent seasons, each starting from the current league
+        state, spread over a process pool. Replica i is seeded from (seed, i) alone, so
+        the merged totals are identical for a given seed whatever the worker count.
+        The simulator's own teams are never modified.
+        """
+        league = pickle.dumps(self.teams, protocol=pickle.HIGHEST_PROTOCOL)
+        summary = ReplicaSummary(self.teams, replicas)
+        for replica_result in _map_replicas(league, _run_season_replica, replicas, workers,
+                                            seed, games_per_team, self.config):
+            summary.add(replica_result)
+        return summary
+
+    def run_sweep(self, grid: Dict[str, Sequence[float]], seasons: int = 10, seed: int = 0,
+                  workers: Optional[int] = None, games_per_team: int = 82) -> "SweepSummary":
+        """
+        Play `seasons` seasons from the current league state for every combination of
+        the grid's SimulationConfig values (applied to this simulator's config), over a
+        process pool, and return league-wide metrics per grid point. Season k of every
+        point is seeded from (seed, k), so all points see the same schedules and differ
+        only through the constants. The simulator's own teams are never modified.
+        """
+        configs = sweep_configs(grid, self.config)
+        league = pickle.dumps(self.teams, protocol=pickle.HIGHEST_PROTOCOL)
+        summary = SweepSummary(list(grid), configs, seasons)
+        for season_result in _map_replicas(league, _run_sweep_season, len(configs) * seasons, workers,
+                                           seed, seasons, games_per_team, configs):
+            summary.add(season_result)
+        return summary
+
+    def simulate_series(self, higher_seed: Team, lower_seed: Team, wins_needed: int = 4,
+                        reporter: Optional[GameReporter] = None) -> tuple[Team, int, int]:
+        """
+        Play a best-of-(2 * wins_needed - 1) series and return (winner, higher seed's wins,
+        lower seed's wins). The higher seed is the home team (team1) in the games given by
+        SERIES_HOME_GAMES. Games count toward team statistics like any other game.
+        """
+        wins = [0, 0]
+        game = 0
+        while max(wins) < wins_needed:
+            if SERIES_HOME_GAMES[game % len(SERIES_HOME_GAMES)]:
+                result = self.simulate_game(higher_seed, lower_seed, reporter)
+                wins[result.score1 < result.score2] += 1
+            else:
+                result = self.simulate_game(lower_seed, higher_seed, reporter)
+                wins[result.score1 > result.score2] += 1
+            game += 1
+        return (higher_seed if wins[0] == wins_needed else lower_seed), wins[0], wins[1]
+
+    def simulate_playoffs(self, seeds: Optional[List[Team]] = None,
+                          reporter: Optional[GameReporter] = None) -> List[List[Team]]:
+        """
+        Play a fixed best-of-seven bracket (1 v 16, 8 v 9, ... with no re-seeding) for the
+        top PLAYOFF_SPOTS teams of the current standings, or `seeds` in seed order.
+        Returns the teams alive at the start of each round in bracket order, followed by
+        [champion]. Games count toward team statistics; run_playoff_replicas leaves the
+        league untouched.
+        """
+        if seeds is None:
+            seeds = self.standings()[:PLAYOFF_SPOTS]
+        alive = [seeds[seed - 1] for seed in bracket_order(len(seeds))]
+        rounds = [alive]
+        while len(alive) > 1:
+            alive = [self.simulate_series(*sorted(alive[i:i + 2], key=seeds.index), reporter=reporter)[0]
+                     for i in range(0, len(alive), 2)]
+            rounds.append(alive)
+        return rounds
+
+    def run_playoff_replicas(self, replicas: int, seed: int = 0,
+                             workers: Optional[int] = None) -> "PlayoffSummary":
+        """
+        Play the playoffs `replicas` times from the current league state (seeded from the
+        current standings) over a process pool. Only the playoff teams are snapshotted, once;
+        every replica plays on its own copy with a generator seeded from (seed, replica)
+        alone, so results are identical for any worker count. The simulator's own teams
+        are never modified.
+        """
+        seeds = self.standings()[:PLAYOFF_SPOTS]
+        bracket = pickle.dumps(seeds, protocol=pickle.HIGHEST_PROTOCOL)
+        summary = PlayoffSummary(seeds, replicas)
+        for replica_result in _map_replicas(bracket, _run_playoff_replica, replicas, workers,
+                                            seed, self.config):
+            summary.add(replica_result)
+        return summary
+
+    def simulate_games_vectorized(self, pairs: List[tuple[Team, Team]],
+                                  apply_stats: bool = True) -> "BatchResult":
+        """
+        Play all games in `pairs` at once with the NumPy engine. Every game starts from
+        the teams' current state; rosters, energies and injuries are not carried between
+        games of the batch. With apply_stats, team records, injury counts and goals of
+        players still on the roster are added exactly as for scalar games.
+        Requires NumPy.
+        """
+        engine = VectorizedEngine(seed=self.rng.randint(0, 2**63 - 1), config=self.config)
+        batch = engine.simulate(pairs)
+        if apply_stats:
+            for g, (team1, team2) in enumerate(pairs):
+                self._update_game_stats(team1, team2, int(batch.score1[g]), int(batch.score2[g]),
+                                        DECISIONS[batch.decision[g]])
+                team1.injuries += int(batch.injuries[g, 0])
+                team2.injuries += int(batch.injuries[g, 1])
+            # Goals by slots that were not replaced belong to the player on the roster.
+            credited = np.where(batch.replaced, 0, batch.goals)
+            for g, side, slot in zip(*np.nonzero(credited)):
+                team, goals = pairs[g][side], int(credited[g, side, slot])
+                team.players[slot].goals_scored += goals
+                self.league_index.record_goal(team, team.players[slot], goals)
+        return batch
+
+    def matchup_odds(self, teams: Optional[List[Team]] = None) -> "MatchupOdds":
+        """
+        Analytical win and decision probabilities for every ordered pair of teams (the
+        whole league by default), from the teams' current state. Nothing is simulated
+        and no team is modified. Requires NumPy.
+        """
+        return AnalyticalEngine(self.config).evaluate(self.teams if teams is None else teams)
+
+    def pair_odds(self, team1: Team, team2: Team) -> Dict[str, float]:
+        """
+        Analytical odds for team1 hosting team2 (see MatchupOdds.pair), served from
+        matchup_cache while neither team has changed. Requires NumPy.
+        """
+        return self.matchup_cache.get(
+            team1, team2, lambda: AnalyticalEngine(self.config).evaluate([team1, team2]).pair(team1, team2))
+
     def _update_game_stats(self, team1: Team, team2: Team, team1_score: int, 
                            team2_score: int, decision: str) -> None:
         team1.games_played += 1
@@ -445,6 +1942,7 @@ class HockeyGameSimulator:
             elif decision == "shootout":
                 team2.shootout_wins += 1
                 team1.shootout_losses += 1
+        self.league_index.record_game(team1, team2)
 
     def show_team_stats(self, team: Team) -> None:
         print(f"\n=== {team} Statistics ===")
@@ -459,14 +1957,16 @@ class HockeyGameSimulator:
         print(f"Goals Against: {team.goals_against}")
         print(f"Total Injuries: {team.injuries}")
 
-        # Skaters sorted by goals scored.
+        # Skaters sorted by goals scored, including regulars on injured reserve.
         # List comprehension and sorting are used here because they provide a concise way to
         # filter and order the players based on a given criterion.
-        skaters = [p for p in team.players if p.position == "Skater"]
+        skaters = [p for p in team.players + team.injured_reserve if p.position == "Skater"]
         skaters_sorted = sorted(skaters, key=lambda p: p.goals_scored, reverse=True)
         print("\nSkaters (sorted by goals scored):")
         for p in skaters_sorted:
-            print(f"Player #{p.jersey_number} - Goals: {p.goals_scored}, Offensive Value: {p.offensive_value}")
+            status = f" (injured, out {p.injury_length} more games)" if p.injured else ""
+            print(f"Player #{p.jersey_number} - Goals: {p.goals_scored}, Offensive Value: {p.offensive_value}"
+                  f"{status}")
 
         # Goaltenders sorted by defensive value.
         goalies_sorted = sorted(team.goaltenders, key=lambda g: g.defensive_value, reverse=True)
@@ -493,26 +1993,28 @@ class HockeyGameSimulator:
                 team2_index = int(input("Select Team 2 (number): ").strip()) - 1
                 if team1_index == team2_index:
                     print("Teams must be different. Using random selection instead.")
-                    team1, team2 = random.sample(self.teams, 2)
+                    team1, team2 = self.rng.sample(self.teams, 2)
                 else:
                     team1 = self.teams[team1_index]
                     team2 = self.teams[team2_index]
             except (ValueError, IndexError):
                 print("Invalid input. Using random teams.")
-                team1, team2 = random.sample(self.teams, 2)
+                team1, team2 = self.rng.sample(self.teams, 2)
         else:
-            team1, team2 = random.sample(self.teams, 2)
+            team1, team2 = self.rng.sample(self.teams, 2)
         
+        reporter = ConsoleReporter(self.print_goals, self.print_injuries, self.print_line_changes)
         for i in range(num_games):
             print(f"\n=== Simulating Game {i+1} ===")
-            self.simulate_game(team1, team2)
+            self.simulate_game(team1, team2, reporter=reporter)
 
     def show_data_menu(self) -> None:
         while True:
             print("\n--- Show Data Menu ---")
             print("1. List all teams")
             print("2. Show team statistics")
-            print("3. Back")
+            print("3. Show standings and goal leaders")
+            print("4. Back")
             choice = input("Select an option: ").strip()
             if choice == "1":
                 self._list_teams()
@@ -528,6 +2030,9 @@ class HockeyGameSimulator:
                 else:
                     print("Invalid input.")
             elif choice == "3":
+                self.show_standings()
+                self.show_leaders()
+            elif choice == "4":
                 break
             else:
                 print("Invalid option. Try again.")
@@ -566,8 +2071,10 @@ class HockeyGameSimulator:
             team.goals_for = 0
             team.goals_against = 0
             team.injuries = 0
-            for p in team.players:
+            for p in team.players + team.injured_reserve:
                 p.goals_scored = 0
+            team.invalidate_fingerprint()
+        self.league_index.rebuild(self.teams)
         print("All team data has been reset.")
 
     def _list_teams(self) -> None:
@@ -576,7 +2083,9 @@ class HockeyGameSimulator:
             print(f"{idx+1}. {team}")
 
     def run(self) -> None:
-        self.create_league()
+        # A loaded snapshot already has its teams.
+        if not self.teams:
+            self.create_league()
         while True:
             print("\n====== Hockey Game Simulator Menu ======")
             print("1. Simulate Game(s)")
@@ -599,9 +2108,1211 @@ class HockeyGameSimulator:
             else:
                 print("Invalid option. Please try again.")
 
+# -----------------------------
+# Vectorized NumPy Engine
+# -----------------------------
+
+class BatchResult:
+    """
+    Outcome of a batch of games from the vectorized engine, one array entry per game.
+    goals[g, side, slot] counts goals by roster slot (team.players index); slots whose
+    player was injured and replaced during that game are flagged in `replaced`.
+    """
+    def __init__(self, pairs: List[tuple[Team, Team]], score1, score2, decision, injuries,
+                 goals, replaced):
+        self.pairs = pairs
+        self.score1 = score1
+        self.score2 = score2
+        self.decision = decision
+        self.injuries = injuries
+        self.goals = goals
+        self.replaced = replaced
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def decision_rates(self) -> Dict[str, float]:
+        counts = np.bincount(self.decision, minlength=len(DECISIONS))
+        return {name: float(counts[code]) / len(self.pairs) for code, name in enumerate(DECISIONS)}
+
+class VectorizedEngine:
+    """
+    Plays many games in lockstep with NumPy arrays. Each game in a batch starts from the
+    current state of its two teams and runs the same rules as the scalar engine
+    (HockeyGameSimulator.simulate_game, which stays the reference implementation), but
+    every step is one batched array operation across all games. Rosters are copied into
+    arrays, so the Team objects themselves are never modified by the engine.
+    """
+    # Sudden-death rounds after which a still-tied shootout is settled by a coin flip.
+    # Only reachable when neither team has a skater who can beat the opposing goalie.
+    MAX_SHOOTOUT_ROUNDS = 1000
+
+    def __init__(self, seed: Optional[int] = None, generator=None,
+                 config: SimulationConfig = DEFAULT_CONFIG):
+        _require_numpy("The vectorized engine")
+        self.generator = generator if generator is not None else np.random.default_rng(seed)
+        self.config = config
+
+    def simulate(self, pairs: List[tuple[Team, Team]]) -> BatchResult:
+        gen = self.generator
+        team_index, team_arrays = self._pack_teams(pairs, self.config)
+        offense, defense, energy, lines, goalie, roster_size = team_arrays
+        sides = np.array([[team_index[id(t1)], team_index[id(t2)]] for t1, t2 in pairs])
+        num_games = len(pairs)
+        games = np.arange(num_games)
+
+        # Per-game copies of the team arrays, shape (games, 2 sides, roster slots).
+        offense = offense[sides]
+        defense = defense[sides]
+        energy = energy[sides]
+        lines = lines[sides]
+        roster_size = roster_size[sides]
+        goalie = goalie[sides]
+        # Teams without an eligible goalie dress an emergency goalie (defense 50-80).
+        emergency = np.isnan(goalie)
+        goalie[emergency] = gen.integers(50, 81, size=int(emergency.sum()))
+
+        current_line = np.zeros((num_games, 2), dtype=np.intp)
+        score = np.zeros((num_games, 2), dtype=np.int64)
+        injuries = np.zeros((num_games, 2), dtype=np.int64)
+        goals = np.zeros(offense.shape, dtype=np.int64)
+        replaced = np.zeros(offense.shape, dtype=bool)
+        state = (games, offense, defense, energy, lines, goalie, current_line,
+                 score, injuries, goals, replaced)
+
+        playing = np.ones(num_games, dtype=bool)
+        for period in range(1, 4):
+            self._play_period(state, period, playing)
+        decision = np.zeros(num_games, dtype=np.int64)
+        tied = score[:, 0] == score[:, 1]
+        if tied.any():
+            decision[tied] = 1
+            self._play_period(state, 4, tied)
+            tied &= score[:, 0] == score[:, 1]
+            if tied.any():
+                decision[tied] = 2
+                score += self._shootout(offense, goalie, roster_size, tied)
+
+        return BatchResult(pairs, score[:, 0], score[:, 1], decision, injuries, goals, replaced)
+
+    @staticmethod
+    def _pack_teams(pairs: List[tuple[Team, Team]], config: SimulationConfig = DEFAULT_CONFIG):
+        # A dictionary keyed by identity maps each distinct team to its row in the arrays.
+        team_index: Dict[int, int] = {}
+        teams: List[Team] = []
+        for pair in pairs:
+            for team in pair:
+                if id(team) not in team_index:
+                    team_index[id(team)] = len(teams)
+                    teams.append(team)
+
+        line_shape = {(len(t.lines), len(line.players)) for t in teams for line in t.lines}
+        if len(line_shape) != 1:
+            raise ValueError("All teams must have the same number of lines and line sizes.")
+        num_lines, line_size = line_shape.pop()
+        slots = max(len(t.players) for t in teams)
+
+        offense = np.zeros((len(teams), slots))
+        defense = np.zeros((len(teams), slots))
+        energy = np.zeros((len(teams), slots))
+        lines = np.zeros((len(teams), num_lines, line_size), dtype=np.intp)
+        goalie = np.full(len(teams), np.nan)
+        roster_size = np.zeros(len(teams), dtype=np.intp)
+        for row, team in enumerate(teams):
+            slot_of = {id(p): slot for slot, p in enumerate(team.players)}
+            for slot, p in enumerate(team.players):
+                offense[row, slot] = p.offensive_value
+                defense[row, slot] = p.defensive_value
+                energy[row, slot] = p.energy
+            for line_number, line in enumerate(team.lines):
+                lines[row, line_number] = [slot_of[id(p)] for p in line.players]
+            roster_size[row] = len(team.players)
+            # Goalie energy never changes during a game, so the goalie chosen by
+            # update_active_goaltender on the first shot stays in net all game: the best
+            # healthy goalie with energy of at least config.goalie_min_energy.
+            eligible = [g.defensive_value for g in team.goaltenders
+                        if not g.injured and g.energy >= config.goalie_min_energy]
+            if eligible:
+                goalie[row] = max(eligible)
+        return team_index, (offense, defense, energy, lines, goalie, roster_size)
+
+    def _play_period(self, state, period: int, playing) -> None:
+        for _ in range(self.config.iterations_per_period):
+            self._team_iteration(state, 0, period, playing)
+            self._team_iteration(state, 1, period, playing)
+            self._update_energy(state, playing)
+
+    def _team_iteration(self, state, side: int, period: int, playing) -> None:
+        gen, config = self.generator, self.config
+        (games, offense, defense, energy, lines, goalie, current_line,
+         score, injuries, goals, replaced) = state
+        other = 1 - side
+        rows = games[:, None]
+        num_games = len(games)
+
+        # Line change: switch to the most rested line when the current one is tired.
+        line_players = lines[games, side, current_line[:, side]]
+        avg_energy = energy[rows, side, line_players].mean(axis=1)
+        tired = playing & (avg_energy < config.line_change_energy)
+        if tired.any():
+            all_lines = energy[games[:, None, None], side, lines[:, side]].mean(axis=2)
+            current_line[tired, side] = all_lines[tired].argmax(axis=1)
+            line_players = lines[games, side, current_line[:, side]]
+            avg_energy = energy[rows, side, line_players].mean(axis=1)
+
+        # Injury: one of the three most tired players on the line is replaced.
+        injury_prob = (avg_energy * config.injury_energy_weight +
+                       period * config.injury_period_weight) / config.injury_divisor
+        hurt = np.flatnonzero(playing & (gen.random(num_games) <= injury_prob))
+        if hurt.size:
+            hurt_lines = line_players[hurt]
+            tiredest = np.argsort(energy[hurt[:, None], side, hurt_lines], axis=1, kind="stable")[:, :3]
+            pick = tiredest[np.arange(hurt.size), gen.integers(0, tiredest.shape[1], size=hurt.size)]
+            slot = hurt_lines[np.arange(hurt.size), pick]
+            offense[hurt, side, slot] = gen.integers(40, 61, size=hurt.size)
+            defense[hurt, side, slot] = gen.integers(50, 101, size=hurt.size)
+            energy[hurt, side, slot] = gen.integers(1, 26, size=hurt.size)
+            replaced[hurt, side, slot] = True
+            injuries[hurt, side] += 1
+            avg_energy = energy[rows, side, line_players].mean(axis=1)
+
+        # Shot and goal probabilities, exactly as in _simulate_team_iteration.
+        line_offense = offense[rows, side, line_players]
+        opponents = lines[games, other, current_line[:, other]]
+        shot_prob = ((avg_energy + (line_offense.mean(axis=1) -
+                      defense[rows, other, opponents].mean(axis=1))) / 100) * 5
+        shooting = playing & (gen.random(num_games) <= shot_prob)
+        # Shooter: uniform among the top three offensive players on the line.
+        top = np.argsort(-line_offense, axis=1, kind="stable")[:, :3]
+        shooter = line_players[games, top[games, gen.integers(0, top.shape[1], size=num_games)]]
+        goal_prob = (energy[games, side, shooter] +
+                     (offense[games, side, shooter] * config.shooter_offense_factor - goalie[:, other])) / 100
+        scored = shooting & (gen.random(num_games) <= goal_prob)
+        score[:, side] += scored
+        goals[games[scored], side, shooter[scored]] += 1
+
+    def _update_energy(self, state, playing) -> None:
+        games, energy, lines, current_line = state[0], state[3], state[4], state[6]
+        on_ice = np.zeros(energy.shape, dtype=bool)
+        for side in (0, 1):
+            on_ice[games[:, None], side, lines[games, side, current_line[:, side]]] = True
+        drained = np.maximum(0, energy - self.generator.uniform(self.config.energy_drain_min,
+                                                                self.config.energy_drain_max, size=energy.shape))
+        rested = np.minimum(25, energy + 1)
+        energy[...] = np.where(playing[:, None, None], np.where(on_ice, drained, rested), energy)
+
+    def _shootout(self, offense, goalie, roster_size, tied):
+        gen = self.generator
+        shootout = np.zeros((len(tied), 2), dtype=np.int64)
+        alive = tied.copy()
+        round_num = 1
+        while alive.any():
+            idx = np.flatnonzero(alive)
+            for side in (0, 1):
+                slot = gen.integers(0, roster_size[idx, side])
+                shootout[idx, side] += offense[idx, side, slot] > goalie[idx, 1 - side]
+            if round_num >= 3:
+                alive[idx] = shootout[idx, 0] == shootout[idx, 1]
+            round_num += 1
+            if round_num > self.MAX_SHOOTOUT_ROUNDS:
+                idx = np.flatnonzero(alive)
+                shootout[idx, gen.integers(0, 2, size=idx.size)] += 1
+                break
+        return shootout
+
+# -----------------------------
+# Analytical Matchup Odds
+# -----------------------------
+
+class MatchupOdds:
+    """
+    Pre-game odds for every ordered pair of teams, from the analytical engine. Arrays are
+    indexed [i, j] for teams[i] hosting teams[j] (teams[i] is team1 of simulate_game).
+    decisions[i, j, code, side] is the chance the game ends with DECISIONS[code] won by
+    side 0 (teams[i]) or side 1 (teams[j]). period_goals[i, j, period - 1, side, k] is the
+    chance that side scores k goals in that period; for period 4 (overtime) that is the
+    distribution if the game gets there.
+    """
+    def __init__(self, teams: List[Team], decisions, period_goals):
+        self.teams = teams
+        self.decisions = decisions
+        self.period_goals = period_goals
+        # A dictionary keyed by identity finds a team's row without scanning the list.
+        self._index: Dict[int, int] = {id(team): i for i, team in enumerate(teams)}
+
+    @property
+    def win(self):
+        """Chance that teams[i] beats teams[j], whatever the decision."""
+        return self.decisions[..., 0].sum(axis=-1)
+
+    @property
+    def expected_goals(self):
+        """Expected goals per period (regulation and overtime if played), [i, j, period - 1, side]."""
+        return (self.period_goals * np.arange(self.period_goals.shape[-1])).sum(axis=-1)
+
+    def pair(self, team1: Team, team2: Team) -> Dict[str, float]:
+        outcome = self.decisions[self._index[id(team1)], self._index[id(team2)]]
+        odds = {"team1_win": float(outcome[:, 0].sum()), "team2_win": float(outcome[:, 1].sum())}
+        odds.update({name: float(outcome[code].sum()) for code, name in enumerate(DECISIONS)})
+        return odds
+
+    def show(self) -> None:
+        # A team's strength is its average chance to win against every other team,
+        # home and away; the matchup against itself is left out.
+        num_teams = len(self.teams)
+        win = self.win
+        points = 2 * win + self.decisions[:, :, 1:, 1].sum(axis=-1)
+        away_points = 2 * (1 - win) + self.decisions[:, :, 1:, 0].sum(axis=-1)
+        others = ~np.eye(num_teams, dtype=bool)
+        strength = ((win + (1 - win).T) * others).sum(axis=1) / (2 * (num_teams - 1))
+        expected_points = ((points + away_points.T) * others).sum(axis=1) / (2 * (num_teams - 1))
+        print(f"\n=== Matchup Odds ({num_teams} teams) ===")
+        print(f"{'Team':<28}{'Win %':>8}{'PTS/GP':>8}")
+        for i in np.argsort(-strength, kind="stable"):
+            print(f"{str(self.teams[i]):<28}{strength[i]:>8.1%}{expected_points[i]:>8.2f}")
+
+class AnalyticalEngine:
+    """
+    Computes matchup odds without playing games. Every skater's energy is followed
+    through a game at its expected value (a mean-field approximation), which fixes each
+    team's line changes and turns its 40 attacks (three periods and overtime) into
+    independent Bernoulli trials with known shot and goal chances. Goal counts are then
+    exact Poisson-binomial distributions of those trials, and a tied game goes to the
+    closed-form shootout of HockeyGameSimulator._sample_shootout. Injuries are ignored.
+
+    A team's expected energies do not depend on its opponent, so the trajectories are
+    computed once per team and every pair is evaluated with array operations; a full
+    32x32 matrix takes tens of milliseconds. The results are approximations of the Monte
+    Carlo engine; benchmarks/compare_analytical.py measures the difference.
+    """
+    PERIODS = 4  # three regulation periods and overtime
+    SHOOTERS = 3
+    # Goalie defense is an integer rating; goal chances are computed on this grid.
+    RATINGS = 101
+    # An emergency goalie's rating (50-80) is drawn once per game and holds all game, so
+    # it is modelled as a mixture over this many rating bands rather than an average.
+    EMERGENCY_BANDS = 6
+
+    def __init__(self, config: SimulationConfig = DEFAULT_CONFIG):
+        _require_numpy("The analytical engine")
+        self.config = config
+
+    def evaluate(self, teams: List[Team]) -> MatchupOdds:
+        # _pack_teams walks pairs of teams; the whole league as one "pair" packs every team once.
+        _, (offense, defense, energy, lines, goalie, roster_size) = \
+            VectorizedEngine._pack_teams([teams], self.config)
+        iterations = self.config.iterations_per_period
+        steps = iterations * self.PERIODS
+        line_energy, line_offense, defense_before, defense_after, shooter_value = \
+            self._trajectories(offense, defense, energy, lines, steps)
+        owner, variant_ratings, team_variants, variant_odds = self._goalie_variants(goalie)
+
+        # Goal chance of an attack against each goalie variant: the mean over the three
+        # shooters of energy + 0.75 * offense - goalie defense, clipped to [0, 100] and
+        # divided by 100, taken over the variant's ratings.
+        per_rating = np.clip(shooter_value[..., None] - np.arange(self.RATINGS), 0.0, 100.0) / 100
+        goal_chance = (per_rating.mean(axis=2) @ variant_ratings.T).transpose(0, 2, 1)
+
+        # team1 attacks before team2 changes lines in the same iteration, so it faces the
+        # defending line from before that change; team2 faces team1's line after it.
+        # Both are [attacker, defending goalie variant, step].
+        first = self._shot_chance(line_energy, line_offense, defense_before[owner]) * goal_chance
+        second = self._shot_chance(line_energy, line_offense, defense_after[owner]) * goal_chance
+
+        # Goal distributions laid out per game [i, j, variant, ...]: team1's against each
+        # goalie variant of teams[j], team2's against each variant of teams[i].
+        chances = np.stack([first, second])
+        periods = self._goal_distribution(
+            chances.reshape(chances.shape[:3] + (self.PERIODS, iterations)))
+        regular = self._goal_distribution(chances[..., :3 * iterations])
+        periods1, periods2 = periods[0][:, team_variants], periods[1][:, team_variants].swapaxes(0, 1)
+        regular1, regular2 = regular[0][:, team_variants], regular[1][:, team_variants].swapaxes(0, 1)
+
+        # Outcomes for every pairing [i, j, k, l] of teams[j]'s goalie variant k and
+        # teams[i]'s variant l, weighted by the chance of that pairing.
+        pairing = variant_odds[None, :, :, None] * variant_odds[:, None, None, :]
+        regular_ahead, regular_tied = self._compare(regular1, regular2)
+        overtime_ahead, overtime_tied = self._compare(periods1[:, :, :, 3], periods2[:, :, :, 3])
+        shootout = self._shootout(offense, roster_size, variant_ratings, team_variants)
+        decisions = np.stack([
+            (pairing[..., None] * regular_ahead).sum(axis=(2, 3)),
+            ((pairing * regular_tied)[..., None] * overtime_ahead).sum(axis=(2, 3)),
+            ((pairing * regular_tied * overtime_tied)[..., None] * shootout).sum(axis=(2, 3)),
+        ], axis=2)
+
+        period_goals = np.stack([
+            (periods1 * variant_odds[None, :, :, None, None]).sum(axis=2),
+            (periods2 * variant_odds[:, None, :, None, None]).sum(axis=2),
+        ], axis=3)
+        return MatchupOdds(teams, decisions, period_goals)
+
+    def _goalie_variants(self, goalie):
+        """
+        The goalies each team may dress, as rows of weights over the rating grid. A team
+        with an eligible goalie has one variant; a team without one dresses an emergency
+        goalie, one variant per rating band. Returns the owning team of each variant,
+        the weight rows, and per team the indices and probabilities of its variants
+        (padded with zero-probability repeats so every team has the same number).
+        """
+        bands = np.array_split(np.arange(50, 81), self.EMERGENCY_BANDS)
+        width = self.EMERGENCY_BANDS if np.isnan(goalie).any() else 1
+        team_variants = np.zeros((len(goalie), width), dtype=np.intp)
+        variant_odds = np.zeros((len(goalie), width))
+        owner: List[int] = []
+        rows = []
+        for team, rating in enumerate(goalie):
+            choices = bands if np.isnan(rating) else [np.array([int(rating)])]
+            total = sum(len(band) for band in choices)
+            team_variants[team] = len(rows)
+            for k, band in enumerate(choices):
+                row = np.zeros(self.RATINGS)
+                row[band] = 1 / len(band)
+                team_variants[team, k] = len(rows)
+                variant_odds[team, k] = len(band) / total
+                owner.append(team)
+                rows.append(row)
+        return np.array(owner), np.array(rows), team_variants, variant_odds
+
+    def _expected_drain(self, energy):
+        # E[max(0, e - U)] for U uniform on [low, high] (1.5 and 6 by default), the drain
+        # of an on-ice player.
+        low, high = self.config.energy_drain_min, self.config.energy_drain_max
+        if high == low:
+            return np.maximum(0.0, energy - low)
+        return np.where(energy >= high, energy - (low + high) / 2,
+                        np.where(energy > low, (energy - low) ** 2 / (2 * (high - low)), 0.0))
+
+    def _trajectories(self, offense, defense, energy, lines, steps: int):
+        rows = np.arange(len(energy))
+        energy = energy.copy()
+        line_offense = offense[rows[:, None, None], lines].mean(axis=2)
+        line_defense = defense[rows[:, None, None], lines].mean(axis=2)
+        # Top shooters of every line, ranked as Line.get_top_offensive_players ranks them.
+        ranking = np.argsort(-offense[rows[:, None, None], lines], axis=2, kind="stable")
+        shooters = np.take_along_axis(lines, ranking[:, :, :self.SHOOTERS], axis=2)
+
+        shape = (len(energy), steps)
+        energy_on_ice, offense_on_ice = np.empty(shape), np.empty(shape)
+        defense_before, defense_after = np.empty(shape), np.empty(shape)
+        shooter_value = np.empty(shape + (self.SHOOTERS,))
+        current = np.zeros(len(energy), dtype=np.intp)  # every game starts with line 1
+        for step in range(steps):
+            defense_before[:, step] = line_defense[rows, current]
+            average = energy[rows[:, None, None], lines].mean(axis=2)
+            tired = average[rows, current] < self.config.line_change_energy
+            current = np.where(tired, average.argmax(axis=1), current)
+            energy_on_ice[:, step] = average[rows, current]
+            offense_on_ice[:, step] = line_offense[rows, current]
+            defense_after[:, step] = line_defense[rows, current]
+            slots = shooters[rows, current]
+            shooter_value[:, step] = (energy[rows[:, None], slots] +
+                                      self.config.shooter_offense_factor * offense[rows[:, None], slots])
+
+            on_ice = np.zeros(energy.shape, dtype=bool)
+            on_ice[rows[:, None], lines[rows, current]] = True
+            energy = np.where(on_ice, self._expected_drain(energy), np.minimum(25, energy + 1))
+        return energy_on_ice, offense_on_ice, defense_before, defense_after, shooter_value
+
+    @staticmethod
+    def _shot_chance(line_energy, line_offense, line_defense):
+        # shot_prob of _simulate_team_iteration for every attacker/defender pair, clipped to [0, 1].
+        shot = (line_energy[:, None] + line_offense[:, None] - line_defense[None]) / 100 * 5
+        return np.clip(shot, 0.0, 1.0)
+
+    @staticmethod
+    def _goal_distribution(chances):
+        # Poisson-binomial distribution of the number of successes over the last axis.
+        # Trials and counts are worked on along the first axis, where each slice is contiguous.
+        chances = np.moveaxis(chances, -1, 0)
+        trials = len(chances)
+        dist = np.zeros((trials + 1,) + chances.shape[1:])
+        dist[0] = 1.0
+        for t in range(trials):
+            # After t trials only counts 0..t are possible, so only that prefix is updated.
+            p = np.ascontiguousarray(chances[t])
+            shifted = dist[:t + 1] * p
+            dist[:t + 1] *= 1 - p
+            dist[1:t + 2] += shifted
+        return np.moveaxis(dist, 0, -1)
+
+    @staticmethod
+    def _compare(dist1, dist2):
+        """
+        Compare independent counts: dist1 [..., k, count] against dist2 [..., l, count].
+        Returns ([..., k, l, 2] chances that either side is ahead, [..., k, l] tie chances).
+        """
+        cdf1, cdf2 = dist1.cumsum(axis=-1), dist2.cumsum(axis=-1)
+        ahead1 = dist1[..., 1:] @ cdf2[..., :-1].swapaxes(-1, -2)
+        ahead2 = (dist2[..., 1:] @ cdf1[..., :-1].swapaxes(-1, -2)).swapaxes(-1, -2)
+        return np.stack([ahead1, ahead2], axis=-1), dist1 @ dist2.swapaxes(-1, -2)
+
+    def _shootout(self, offense, roster_size, variant_ratings, team_variants):
+        # Share of each team's skaters who beat each goalie rating, then each goalie variant.
+        ratings = np.arange(self.RATINGS)
+        on_roster = np.arange(offense.shape[1]) < roster_size[:, None]
+        beats = ((offense[..., None] > ratings) & on_roster[..., None]).sum(axis=1) / roster_size[:, None]
+        scoring = (beats @ variant_ratings.T)[:, team_variants]    # [shooters, goalie's team, variant]
+        p1, p2 = scoring, scoring.swapaxes(0, 1)
+        ahead, tied = self._compare(self._goal_distribution(np.repeat(p1[..., None], 3, axis=-1)),
+                                    self._goal_distribution(np.repeat(p2[..., None], 3, axis=-1)))
+        # Sudden death: the first round where exactly one team scores decides it.
+        p1, p2 = p1[..., :, None], p2[..., None, :]
+        decisive = p1 * (1 - p2) + p2 * (1 - p1)
+        first_wins = np.divide(p1 * (1 - p2), decisive, out=np.full_like(decisive, 0.5),
+                               where=decisive > 0)
+        return ahead + tied[..., None] * np.stack([first_wins, 1 - first_wins], axis=-1)
+
+class MatchupCache:
+    """
+    LRU cache of single-matchup odds keyed by both teams' fingerprints and the config
+    they play by. A key describes the teams' state rather than the Team objects, so
+    anything that changes a team (a game, an injury replacement, reset_data) makes its
+    next lookup a miss, and entries for states that no longer exist age out of the
+    cache. Hits, misses and evictions are counted for monitoring.
+    """
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        # An OrderedDict keeps entries in recency order: a hit moves its entry to the end,
+        # so the least recently used entry is always first and eviction is O(1).
+        self._entries: "OrderedDict[tuple, Dict[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, team1: Team, team2: Team, compute) -> Dict[str, float]:
+        """Odds for team1 hosting team2, from the cache or from compute() on a miss."""
+        key = (team1.fingerprint(), team2.fingerprint(), team1.config)
+        odds = self._entries.get(key)
+        if odds is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            odds = self._entries[key] = compute()
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        # A copy, so callers cannot change the cached entry.
+        return dict(odds)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def info(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._entries), "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+# -----------------------------
+# Parallel Season Replicas
+# -----------------------------
+
+# Team counters merged across replicas. A tuple keeps the field order fixed so each
+# replica can return its statistics as a plain tuple of integers per team.
+TEAM_STAT_FIELDS = ("games_played", "regular_wins", "overtime_wins", "shootout_wins",
+                    "regular_losses", "overtime_losses", "shootout_losses",
+                    "goals_for", "goals_against", "injuries")
+
+PLAYOFF_SPOTS = 16
+
+# Pickled league shared by every replica in a worker process (set by the initializer),
+# so the league is sent to each worker once instead of once per task.
+_replica_league: bytes = b""
+
+def replica_seed(master_seed: int, replica: int) -> str:
+    # String seeds are hashed with SHA-512 by random.seed, giving independent,
+    # platform-stable streams that depend only on the master seed and replica index.
+    return f"{master_seed}:{replica}"
+
+def _init_replica_worker(league: bytes) -> None:
+    global _replica_league
+    _replica_league = league
+
+def _map_replicas(league: bytes, task, replicas: int, workers: Optional[int], *args) -> Iterator:
+    """
+    Yield task(replica, *args) for replicas 0..replicas-1, in replica order, from a
+    process pool whose workers share the pickled `league` (in this process with one worker).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        _init_replica_worker(league)
+        for replica in range(replicas):
+            yield task(replica, *args)
+        return
+
+    # Imported here, like asyncio in the service: single-process runs never need it.
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, replicas // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_replica_worker,
+                             initargs=(league,)) as executor:
+        # map() yields results in replica order, keeping the merge deterministic.
+        yield from executor.map(task, range(replicas), *([arg] * replicas for arg in args),
+                                chunksize=chunksize)
+
+def _run_season_replica(replica: int, master_seed: int, games_per_team: int,
+                        config: SimulationConfig = DEFAULT_CONFIG) -> tuple:
+    """
+    Play one full season on a fresh copy of the shared league and return
+    (team stat tuples, player goal totals, playoff team indexes).
+    """
+    simulator = HockeyGameSimulator(rng=random.Random(replica_seed(master_seed, replica)), config=config)
+    simulator.adopt_teams(pickle.loads(_replica_league))
+    simulator.simulate_season(simulator.build_schedule(games_per_team))
+
+    team_stats = [tuple(getattr(team, field) for field in TEAM_STAT_FIELDS) for team in simulator.teams]
+    player_goals = {(index, player.jersey_number): player.goals_scored
+                    for index, team in enumerate(simulator.teams)
+                    for player in team.players + team.injured_reserve if player.goals_scored}
+    # Index lookup by identity: a dictionary avoids repeated list.index scans.
+    team_index = {id(team): index for index, team in enumerate(simulator.teams)}
+    playoff_teams = [team_index[id(team)] for team in simulator.standings()[:PLAYOFF_SPOTS]]
+    return team_stats, player_goals, playoff_teams
+
+class ReplicaSummary:
+    """Totals merged from many independent season replicas of the same league."""
+    def __init__(self, teams: List[Team], replicas: int):
+        self.team_names = [str(team) for team in teams]
+        self.replicas = replicas
+        # One row of summed counters per team, in TEAM_STAT_FIELDS order.
+        self.team_totals: List[List[int]] = [[0] * len(TEAM_STAT_FIELDS) for _ in teams]
+        # Keyed by (team index, jersey number); replacement players can reuse a jersey,
+        # so a key identifies a roster spot rather than one specific player.
+        self.player_goals: Dict[tuple[int, int], int] = {}
+        self.playoff_appearances = [0] * len(teams)
+
+    def add(self, replica_result: tuple) -> None:
+        team_stats, player_goals, playoff_teams = replica_result
+        for totals, stats in zip(self.team_totals, team_stats):
+            for i, value in enumerate(stats):
+                totals[i] += value
+        for key, goals in player_goals.items():
+            self.player_goals[key] = self.player_goals.get(key, 0) + goals
+        for index in playoff_teams:
+            self.playoff_appearances[index] += 1
+
+    def average(self, team_index: int, field: str) -> float:
+        return self.team_totals[team_index][TEAM_STAT_FIELDS.index(field)] / self.replicas
+
+    def average_points(self, team_index: int) -> float:
+        totals = dict(zip(TEAM_STAT_FIELDS, self.team_totals[team_index]))
+        wins = totals["regular_wins"] + totals["overtime_wins"] + totals["shootout_wins"]
+        return (2 * wins + totals["overtime_losses"] + totals["shootout_losses"]) / self.replicas
+
+    def playoff_odds(self) -> List[float]:
+        return [count / self.replicas for count in self.playoff_appearances]
+
+    def show(self) -> None:
+        print(f"\n=== {self.replicas} Season Replicas ===")
+        print(f"{'Team':<28}{'Avg PTS':>9}{'Avg GF':>8}{'Avg GA':>8}{'Playoffs':>10}")
+        odds = self.playoff_odds()
+        order = sorted(range(len(self.team_names)), key=lambda i: (odds[i], self.average_points(i)), reverse=True)
+        for i in order:
+            print(f"{self.team_names[i]:<28}{self.average_points(i):>9.1f}"
+                  f"{self.average(i, 'goals_for'):>8.1f}{self.average(i, 'goals_against'):>8.1f}"
+                  f"{odds[i]:>9.1%}")
+
+# -----------------------------
+# Playoff Replicas
+# -----------------------------
+
+PLAYOFF_ROUNDS = ("Round 1", "Round 2", "Semifinal", "Final")
+# Which games of a series the higher seed hosts (2-2-1-1-1 format).
+SERIES_HOME_GAMES = (True, True, False, False, True, False, True)
+
+def bracket_order(teams: int) -> List[int]:
+    """
+    Seeds in bracket order for a power-of-two field, so neighbouring pairs meet and
+    the top seeds can only meet late: [1, 16, 8, 9, 4, 13, 5, 12, 2, 15, 7, 10, 3, 14, 6, 11].
+    """
+    order = [1]
+    while len(order) < teams:
+        size = 2 * len(order)
+        order = [seed for top in order for seed in (top, size + 1 - top)]
+    return order
+
+def _run_playoff_replica(replica: int, master_seed: int,
+                         config: SimulationConfig = DEFAULT_CONFIG) -> List[List[int]]:
+    """
+    Play the bracket once on a fresh copy of the shared playoff teams (stored in seed
+    order) and return the seed indexes (0-based) of each round's series winners.
+    """
+    simulator = HockeyGameSimulator(rng=random.Random(replica_seed(master_seed, replica)), config=config)
+    seeds = pickle.loads(_replica_league)
+    simulator.adopt_teams(seeds)
+    # Index lookup by identity, as in _run_season_replica.
+    seed_index = {id(team): index for index, team in enumerate(seeds)}
+    rounds = simulator.simulate_playoffs(seeds)
+    return [[seed_index[id(team)] for team in winners] for winners in rounds[1:]]
+
+class PlayoffSummary:
+    """Series won per round by each playoff team, merged from many bracket replicas."""
+    def __init__(self, seeds: List[Team], replicas: int):
+        self.team_names = [str(team) for team in seeds]  # in seed order
+        self.replicas = replicas
+        # One row per seed: how many replicas it won its series in each round.
+        self.series_won: List[List[int]] = [[0] * len(PLAYOFF_ROUNDS) for _ in seeds]
+
+    def add(self, replica_result: List[List[int]]) -> None:
+        for round_index, winners in enumerate(replica_result):
+            for seed_index in winners:
+                self.series_won[seed_index][round_index] += 1
+
+    def advance_odds(self) -> List[List[float]]:
+        """Per seed, the probability of winning each round (the last one is the title)."""
+        return [[count / self.replicas for count in row] for row in self.series_won]
+
+    def show(self) -> None:
+        print(f"\n=== {self.replicas} Playoff Replicas ===")
+        print(f"{'Seed':>4}  {'Team':<28}" + "".join(f"{'Won ' + name:>14}" for name in PLAYOFF_ROUNDS))
+        for seed, (name, odds) in enumerate(zip(self.team_names, self.advance_odds()), start=1):
+            print(f"{seed:>4}  {name:<28}" + "".join(f"{chance:>14.1%}" for chance in odds))
+
+# -----------------------------
+# Parameter Sweeps
+# -----------------------------
+
+def sweep_configs(grid: Dict[str, Sequence[float]],
+                  base: SimulationConfig = DEFAULT_CONFIG) -> List[SimulationConfig]:
+    """Every combination of the grid's values applied to base (the last parameter varies fastest)."""
+    unknown = [name for name in grid if name not in SimulationConfig._fields]
+    if unknown:
+        raise ValueError(f"Unknown config parameters: {', '.join(unknown)}.")
+    configs = [base._replace(**dict(zip(grid, values))) for values in itertools.product(*grid.values())]
+    for config in configs:
+        config.validate()
+    return configs
+
+def _run_sweep_season(task: int, master_seed: int, seasons: int, games_per_team: int,
+                      configs: List[SimulationConfig]) -> tuple:
+    """
+    Play season task % seasons of grid point task // seasons on a fresh copy of the
+    shared league and return (point, games, goals, overtime games, shootout games, injuries).
+    """
+    point, season = divmod(task, seasons)
+    simulator = HockeyGameSimulator(rng=random.Random(replica_seed(master_seed, season)),
+                                    config=configs[point])
+    simulator.adopt_teams(pickle.loads(_replica_league))
+    results = simulator.simulate_season(simulator.build_schedule(games_per_team))
+    # Goals are counted from the goal events, so shootout winners do not count as goals.
+    return (point, len(results), sum(len(result.goals) for result in results),
+            sum(result.decision == "overtime" for result in results),
+            sum(result.decision == "shootout" for result in results),
+            sum(len(result.injuries) for result in results))
+
+class SweepSummary:
+    """League-wide metrics per grid point, merged from the seasons of a parameter sweep."""
+    METRICS = ("goals_per_game", "goals_per_game_se", "overtime_rate", "shootout_rate",
+               "injuries_per_game")
+
+    def __init__(self, parameters: List[str], configs: List[SimulationConfig], seasons: int):
+        self.parameters = parameters
+        self.configs = configs
+        self.seasons = seasons
+        # Per grid point: [games, goals, overtime games, shootout games, injuries] summed
+        # over its seasons, plus each season's goals per game for the standard error.
+        self.totals: List[List[int]] = [[0] * 5 for _ in configs]
+        self.season_goal_rates: List[List[float]] = [[] for _ in configs]
+
+    def add(self, season_result: tuple) -> None:
+        point, *counts = season_result
+        for i, count in enumerate(counts):
+            self.totals[point][i] += count
+        self.season_goal_rates[point].append(counts[1] / counts[0])
+
+    def rows(self) -> List[Dict[str, float]]:
+        """One dictionary per grid point: the swept parameters, then seasons, games and METRICS."""
+        rows = []
+        for config, (games, goals, overtime, shootout, injuries), rates in zip(
+                self.configs, self.totals, self.season_goal_rates):
+            # Standard error of goals per game across seasons (0 with a single season).
+            mean = sum(rates) / len(rates)
+            spread = (math.sqrt(sum((rate - mean) ** 2 for rate in rates) / (len(rates) - 1) / len(rates))
+                      if len(rates) > 1 else 0.0)
+            row = {name: getattr(config, name) for name in self.parameters}
+            row.update(seasons=len(rates), games=games, goals_per_game=goals / games,
+                       # Rates by decision, as in ResultStoreReader: overtime counts only the
+                       # games won in overtime, not those that went on to a shootout.
+                       goals_per_game_se=spread, overtime_rate=overtime / games,
+                       shootout_rate=shootout / games, injuries_per_game=injuries / games)
+            rows.append(row)
+        return rows
+
+    def write_csv(self, path: str) -> None:
+        rows = self.rows()
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def show(self) -> None:
+        print(f"\n=== Parameter Sweep: {len(self.configs)} points x {self.seasons} seasons ===")
+        print("".join(f"{name:>24}" for name in self.parameters) +
+              f"{'Goals/GP':>10}{'+/-':>7}{'OT rate':>9}{'SO rate':>9}{'Inj/GP':>8}")
+        for row in self.rows():
+            print("".join(f"{row[name]:>24}" for name in self.parameters) +
+                  f"{row['goals_per_game']:>10.3f}{row['goals_per_game_se']:>7.3f}"
+                  f"{row['overtime_rate']:>9.1%}{row['shootout_rate']:>9.1%}{row['injuries_per_game']:>8.3f}")
+
+# -----------------------------
+# Simulation Service
+# -----------------------------
+
+def _game_payload(result: GameResult) -> dict:
+    return {
+        "team1": str(result.team1), "team2": str(result.team2),
+        "score1": result.score1, "score2": result.score2,
+        "decision": result.decision, "winner": str(result.winner),
+        "shootout": list(result.shootout_score) if result.shootout_score else None,
+        "goals": [{"period": g.period, "team": str(g.team), "jersey": g.player.jersey_number}
+                  for g in result.goals],
+        "injuries": [{"period": i.period, "team": str(i.team), "jersey": i.player.jersey_number}
+                     for i in result.injuries],
+    }
+
+def _standings_payload(teams: List[Team]) -> List[dict]:
+    return [{"rank": rank, "team": str(team), "gp": team.games_played, "w": team.wins,
+             "l": team.regular_losses, "otl": team.overtime_losses + team.shootout_losses,
+             "pts": team.points, "gf": team.goals_for, "ga": team.goals_against}
+            for rank, team in enumerate(teams, start=1)]
+
+def _service_game(index1: int, index2: int, config: SimulationConfig, seed: int) -> dict:
+    """Worker task: one game on a fresh copy of the shared league (see _init_replica_worker)."""
+    simulator = HockeyGameSimulator(seed=seed, config=config)
+    simulator.adopt_teams(pickle.loads(_replica_league))
+    return _game_payload(simulator.simulate_game(simulator.teams[index1], simulator.teams[index2]))
+
+def _service_season(games_per_team: int, config: SimulationConfig, seed: int) -> List[dict]:
+    """Worker task: a full season on a fresh copy of the shared league, as final standings."""
+    simulator = HockeyGameSimulator(seed=seed, config=config)
+    simulator.adopt_teams(pickle.loads(_replica_league))
+    simulator.simulate_season(simulator.build_schedule(games_per_team))
+    return _standings_payload(simulator.standings())
+
+class ServiceError(Exception):
+    """A request the service answers with an HTTP error status and a JSON message."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class SimulationService:
+    """
+    Asyncio HTTP/JSON front end for one league (standard library only). Endpoints,
+    as GET query parameters or a POST JSON object:
+
+        /standings                          current standings of the served league
+        /leaders?[count=10]                 its top scorers
+        /game?team1=..&team2=..[&seed=]     one game (teams by "City Name" or index)
+        /season?[games_per_team=82][&seed=] a full season, returned as final standings
+        /odds?team1=..&team2=..             analytical matchup odds (needs NumPy)
+        /stats                              service counters
+
+    Games and seasons run on copies of the league in a process pool, so the event
+    loop stays free and the served league never changes. Identical requests that
+    arrive while one is being computed share its result (coalescing), at most
+    `workers` jobs run at once, and once `max_pending` jobs are running or queued
+    new ones are refused with 503 (backpressure). Responses carry the seed used, so
+    any result can be reproduced.
+    """
+    MAX_BODY = 64 * 1024
+    MAX_HEADERS = 100
+    READ_TIMEOUT = 10.0
+    REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error", 501: "Not Implemented",
+               503: "Service Unavailable"}
+
+    def __init__(self, simulator: HockeyGameSimulator, workers: Optional[int] = None,
+                 max_pending: Optional[int] = None):
+        if not simulator.teams:
+            simulator.create_league()
+        self.simulator = simulator
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending if max_pending is not None else 8 * self.workers
+        # A dictionary keyed by team name resolves request parameters in O(1).
+        self._by_name = {str(team): index for index, team in enumerate(simulator.teams)}
+        # Jobs being computed, keyed by endpoint and parameters; identical requests
+        # await the same future instead of starting another job.
+        self._in_flight: Dict[tuple, "asyncio.Future"] = {}
+        self._executor: Optional["ProcessPoolExecutor"] = None
+        self._slots: Optional["asyncio.Semaphore"] = None
+        self._seeds = random.Random()
+        self.pending = 0
+        self.counters = {"requests": 0, "jobs": 0, "coalesced": 0, "rejected": 0, "errors": 0}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> "asyncio.AbstractServer":
+        # asyncio is imported where the service uses it: nothing else needs it, and it is a
+        # sizeable share of this module's import time for short batch runs.
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+        league = pickle.dumps(self.simulator.teams, protocol=pickle.HIGHEST_PROTOCOL)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_replica_worker,
+                                             initargs=(league,))
+        self._slots = asyncio.Semaphore(self.workers)
+        # Start the workers before listening: forked lazily on the first job, they would
+        # inherit that request's socket and keep the connection open after we close it.
+        await asyncio.get_running_loop().run_in_executor(self._executor, int)
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        server = await self.start(host, port)
+        address = server.sockets[0].getsockname()
+        print(f"Serving {len(self.simulator.teams)} teams on http://{address[0]}:{address[1]} "
+              f"with {self.workers} workers (Ctrl+C to stop).")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    # --- HTTP ---
+
+    async def _handle_connection(self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter") -> None:
+        import asyncio
+        # One request per connection (Connection: close keeps the protocol handling small).
+        try:
+            try:
+                method, target, body = await asyncio.wait_for(self._read_request(reader), self.READ_TIMEOUT)
+                status, payload = 200, await self.dispatch(method, target, body)
+            except ServiceError as error:
+                status, payload = error.status, {"error": str(error)}
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, UnicodeDecodeError):
+                status, payload = 400, {"error": "malformed request"}
+            except Exception as error:  # a failed job must not take the connection handler down
+                status, payload = 500, {"error": f"{type(error).__name__}: {error}"}
+            if status != 200:
+                self.counters["rejected" if status == 503 else "errors"] += 1
+            body = json.dumps(payload).encode("utf-8")
+            headers = [f"HTTP/1.1 {status} {self.REASONS.get(status, 'Error')}",
+                       "Content-Type: application/json", f"Content-Length: {len(body)}",
+                       "Connection: close"]
+            if status == 503:
+                headers.append("Retry-After: 1")
+            writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("ascii") + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: "asyncio.StreamReader") -> tuple[str, str, bytes]:
+        method, target, _ = (await reader.readline()).decode("ascii").split()
+        length = 0
+        for _ in range(self.MAX_HEADERS):
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        else:
+            raise ValueError("too many headers")
+        if length > self.MAX_BODY:
+            raise ServiceError(413, f"request body over {self.MAX_BODY} bytes")
+        return method.upper(), target, await reader.readexactly(length) if length else b""
+
+    # --- Endpoints ---
+
+    async def dispatch(self, method: str, target: str, body: bytes = b"") -> object:
+        """Answer one request; raises ServiceError for anything that is not a 200."""
+        self.counters["requests"] += 1
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        if method == "POST" and body:
+            data = json.loads(body)
+            if not isinstance(data, dict):
+                raise ServiceError(400, "POST body must be a JSON object")
+            params.update({key: str(value) for key, value in data.items()})
+        elif method not in ("GET", "POST"):
+            raise ServiceError(405, f"method {method} not allowed")
+
+        path = url.path.rstrip("/")
+        if path == "/standings":
+            return _standings_payload(self.simulator.standings())
+        if path == "/leaders":
+            count = self._int_param(params, "count", 10)
+            if not 1 <= count <= 1000:
+                raise ServiceError(400, "count must be between 1 and 1000")
+            return [{"rank": rank, "team": str(team), "jersey": player.jersey_number, "goals": goals}
+                    for rank, (team, player, goals) in enumerate(self.simulator.leaders(count), start=1)]
+        if path == "/stats":
+            return dict(self.counters, pending=self.pending, in_flight=len(self._in_flight),
+                        workers=self.workers, max_pending=self.max_pending)
+        if path == "/odds":
+            try:
+                _require_numpy("Odds")
+            except ImportError:
+                raise ServiceError(501, "odds need NumPy on the server") from None
+            team1, team2 = self._team_param(params, "team1"), self._team_param(params, "team2")
+            teams = self.simulator.teams
+            return dict(self.simulator.pair_odds(teams[team1], teams[team2]),
+                        team1=str(teams[team1]), team2=str(teams[team2]))
+        if path == "/game":
+            team1, team2 = self._team_param(params, "team1"), self._team_param(params, "team2")
+            if team1 == team2:
+                raise ServiceError(400, "a team cannot play itself")
+            seed = self._int_param(params, "seed", None)
+            return await self._coalesced(("game", team1, team2, seed), seed, _service_game,
+                                         team1, team2, self.simulator.config)
+        if path == "/season":
+            games = self._int_param(params, "games_per_team", 82)
+            if not 1 <= games <= 164:
+                raise ServiceError(400, "games_per_team must be between 1 and 164")
+            seed = self._int_param(params, "seed", None)
+            return await self._coalesced(("season", games, seed), seed, _service_season,
+                                         games, self.simulator.config)
+        raise ServiceError(404, f"unknown endpoint {url.path}")
+
+    async def _coalesced(self, key: tuple, seed: Optional[int], task, *args) -> dict:
+        """
+        Run task(*args, seed) in the process pool, or join the identical job already
+        running. Requests without a seed coalesce too (their key holds None); the first
+        one draws the seed and every duplicate gets the same result back.
+        """
+        import asyncio
+        shared = self._in_flight.get(key)
+        if shared is not None:
+            self.counters["coalesced"] += 1
+            return await asyncio.shield(shared)
+        if self.pending >= self.max_pending:
+            raise ServiceError(503, "server busy, retry later")
+
+        if seed is None:
+            seed = self._seeds.randrange(2**32)
+        loop = asyncio.get_running_loop()
+        shared = self._in_flight[key] = loop.create_future()
+        self.pending += 1
+        try:
+            async with self._slots:
+                self.counters["jobs"] += 1
+                payload = {"seed": seed, "result": await loop.run_in_executor(self._executor, task, *args, seed)}
+            shared.set_result(payload)
+            return payload
+        except Exception as error:
+            shared.set_exception(error)
+            shared.exception()  # retrieved here, so a job nobody else joined is not reported twice
+            raise
+        finally:
+            if not shared.done():  # cancelled, e.g. at shutdown: release any duplicates
+                shared.cancel()
+            self.pending -= 1
+            del self._in_flight[key]
+
+    def _team_param(self, params: Dict[str, str], name: str) -> int:
+        value = params.get(name)
+        if value is None:
+            raise ServiceError(400, f"missing parameter {name}")
+        if value.isdigit() and int(value) < len(self.simulator.teams):
+            return int(value)
+        if value not in self._by_name:
+            raise ServiceError(400, f"unknown team {value!r}")
+        return self._by_name[value]
+
+    @staticmethod
+    def _int_param(params: Dict[str, str], name: str, default: Optional[int]) -> Optional[int]:
+        value = params.get(name)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ServiceError(400, f"{name} must be an integer") from None
+
 # -----------------------------
 # Main entry point
 # -----------------------------
+def _sweep_axis(spec: str) -> tuple[str, List[float]]:
+    # "line_change_energy=16,18,20" -> ("line_change_energy", [16, 18, 20]); whole numbers
+    # stay ints so integer constants (iterations, injury games) can be swept too.
+    name, _, values = spec.partition("=")
+    if name not in SimulationConfig._fields or not values:
+        raise argparse.ArgumentTypeError(f"expected PARAM=V1,V2,... with a SimulationConfig field, got {spec!r}")
+    try:
+        return name, [int(value) if value.strip().lstrip("-").isdigit() else float(value)
+                      for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid values in {spec!r}") from None
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Hockey game simulator. Run without options for the interactive menu.")
+    parser.add_argument("--season", action="store_true",
+                        help="simulate a full season without prompts and print the standings")
+    parser.add_argument("--games-per-team", type=int, default=82, metavar="N",
+                        help="games per team in the round-robin schedule (default: 82)")
+    parser.add_argument("--schedule", metavar="FILE",
+                        help='custom schedule file with one "Team One,Team Two" game per line')
+    parser.add_argument("--seed", type=int, help="random seed for a reproducible run")
+    parser.add_argument("--verbose", action="store_true",
+                        help="print the play-by-play of every game")
+    parser.add_argument("--replicas", type=int, metavar="N",
+                        help="simulate N independent seasons in parallel and print average results")
+    parser.add_argument("--playoffs", type=int, metavar="N",
+                        help="after the season (or from a --load snapshot), play the 16-team "
+                             "playoff bracket N times in parallel and print round-by-round odds")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="worker processes for --replicas and --playoffs (default: one per CPU)")
+    parser.add_argument("--events", metavar="FILE",
+                        help="stream every game event to FILE (.jsonl or .csv, add .gz to compress)")
+    parser.add_argument("--store", metavar="DIR",
+                        help="write every game result to a binary result store in DIR")
+    parser.add_argument("--query-store", metavar="DIR",
+                        help="print standings, goal leaders and OT/shootout rates from a result store "
+                             "(needs NumPy)")
+    parser.add_argument("--load", metavar="FILE",
+                        help="start from a league snapshot instead of generating a new league "
+                             "(with --seed, fork it onto a new random stream)")
+    parser.add_argument("--save", metavar="FILE",
+                        help="save a league snapshot after the run")
+    parser.add_argument("--sweep", type=_sweep_axis, action="append", metavar="PARAM=V1,V2,...",
+                        help="sweep a SimulationConfig constant over these values (repeat for a grid); "
+                             f"one of: {', '.join(SimulationConfig._fields)}")
+    parser.add_argument("--sweep-seasons", type=int, default=10, metavar="N",
+                        help="seasons per grid point for --sweep (default: 10)")
+    parser.add_argument("--sweep-out", metavar="FILE", help="write the --sweep results table as CSV")
+    parser.add_argument("--odds", action="store_true",
+                        help="print analytical win odds for every team against the league "
+                             "(needs NumPy)")
+    parser.add_argument("--serve", action="store_true",
+                        help="serve games, seasons, standings and odds as HTTP/JSON "
+                             "(uses --workers processes)")
+    parser.add_argument("--host", default="127.0.0.1", help="address for --serve (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port for --serve (default: 8765)")
+    parser.add_argument("--profile", action="store_true",
+                        help="collect engine stats and print a cProfile report for the batch run "
+                             "(replicas then run in-process so the profiler sees them)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.query_store:
+        ResultStoreReader(args.query_store).show()
+        return
+    if args.load:
+        simulator = HockeyGameSimulator.load(args.load, seed=args.seed)
+    else:
+        simulator = HockeyGameSimulator(seed=args.seed)
+    if args.serve:
+        import asyncio
+        service = SimulationService(simulator, workers=args.workers)
+        try:
+            asyncio.run(service.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            print("\nService stopped.")
+        return
+    if args.sweep:
+        if not simulator.teams:
+            simulator.create_league()
+        grid = dict(args.sweep)
+        try:
+            # Checked against the league's own config (a --load snapshot carries one), so an
+            # unplayable grid value is a usage error instead of a traceback from run_sweep.
+            sweep_configs(grid, simulator.config)
+        except ValueError as error:
+            sys.exit(f"error: --sweep: {error}")
+        points = math.prod(len(values) for values in grid.values())
+        print(f"Sweeping {points} grid points x {args.sweep_seasons} seasons...")
+        start = time.perf_counter()
+        sweep = simulator.run_sweep(grid, seasons=args.sweep_seasons, seed=args.seed or 0,
+                                    workers=args.workers, games_per_team=args.games_per_team)
+        elapsed = time.perf_counter() - start
+        sweep.show()
+        if args.sweep_out:
+            sweep.write_csv(args.sweep_out)
+            print(f"\nWrote {points} rows to {args.sweep_out}")
+        print(f"\nSimulated {points * args.sweep_seasons} seasons in {elapsed:.2f}s.")
+        return
+    if args.odds:
+        if not simulator.teams:
+            simulator.create_league()
+        start = time.perf_counter()
+        odds = simulator.matchup_odds()
+        elapsed = time.perf_counter() - start
+        odds.show()
+        print(f"\nComputed {len(odds.teams) ** 2} matchups in {elapsed * 1000:.1f} ms.")
+        return
+    if not (args.season or args.schedule or args.replicas or args.playoffs):
+        simulator.run()
+        return
+
+    if not simulator.teams:
+        simulator.create_league()
+    profiler = None
+    if args.profile:
+        # Profiling modules are imported only when asked for (startup time of short runs).
+        import cProfile
+        simulator.enable_stats()
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    if args.replicas:
+        workers = 1 if args.profile else args.workers
+        start = time.perf_counter()
+        summary = simulator.run_replicas(args.replicas, seed=args.seed or 0, workers=workers,
+                                         games_per_team=args.games_per_team)
+        elapsed = time.perf_counter() - start
+        summary.show()
+        print(f"\nSimulated {args.replicas} seasons in {elapsed:.2f}s.")
+    elif args.season or args.schedule:
+        if args.schedule:
+            schedule = simulator.load_schedule(args.schedule)
+        else:
+            schedule = simulator.build_schedule(args.games_per_team)
+        # The event log needs its own recorder, so it takes the place of --verbose output.
+        recorder = EventRecorder() if args.events else None
+        reporter = recorder or (ConsoleReporter() if args.verbose else None)
+
+        start = time.perf_counter()
+        with ExitStack() as outputs:
+            sink = outputs.enter_context(open_event_sink(args.events)) if args.events else None
+            store = outputs.enter_context(ResultStoreWriter(args.store, simulator.teams)) if args.store else None
+            for team1, team2 in schedule:
+                result = simulator.simulate_game(team1, team2, reporter)
+                if sink is not None:
+                    sink.write_all(recorder.drain())
+                if store is not None:
+                    store.add(result)
+        elapsed = time.perf_counter() - start
+        if sink is not None:
+            print(f"Wrote {sink.count} events to {args.events}")
+        if store is not None:
+            print(f"Wrote {store.games_written} games to the result store in {args.store}")
+
+        simulator.show_standings()
+        simulator.show_leaders()
+        print(f"\nSimulated {len(schedule)} games in {elapsed:.2f}s "
+              f"({len(schedule) / elapsed:.0f} games/sec).")
+
+    if args.playoffs:
+        workers = 1 if args.profile else args.workers
+        start = time.perf_counter()
+        playoffs = simulator.run_playoff_replicas(args.playoffs, seed=args.seed or 0, workers=workers)
+        elapsed = time.perf_counter() - start
+        playoffs.show()
+        print(f"\nSimulated {args.playoffs} playoff brackets in {elapsed:.2f}s.")
+
+    if args.save:
+        simulator.save(args.save)
+        print(f"League snapshot saved to {args.save}")
+
+    if profiler is not None:
+        profiler.disable()
+        # Replicas run on their own simulators, so only season runs fill these stats.
+        if simulator.stats.counters["periods"]:
+            print("\n" + simulator.stats.report())
+        print()
+        import pstats
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
 if __name__ == "__main__":
-    simulator = HockeyGameSimulator()
-    simulator.run()
+    main()